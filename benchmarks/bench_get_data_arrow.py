@@ -0,0 +1,64 @@
+'''
+Compare get_data through SQLAlchemy/pd.read_sql with the Arrow columnar path.
+
+Each mode runs in its own process so the reported peak RSS is not shared.
+
+python benchmarks/bench_get_data_arrow.py --user login --database dwh --rows 1000000
+'''
+import argparse
+import multiprocessing as mp
+import timeit
+
+from rss import peak_rss_mb
+
+DEFAULT_QUERY = '''
+select level as id,
+       mod(level, 1000) as cell_id,
+       'region_' || mod(level, 17) as region,
+       sysdate - mod(level, 365) as report_date,
+       dbms_random.value * 1000 as kpi_value
+  from dual
+connect by level <= {rows}
+'''
+
+
+def run_mode(mode, args, queue):
+    from nurtelecom_gras_library import get_db_connection
+    database_connection = get_db_connection(args.user, args.database)
+    query = args.query or DEFAULT_QUERY.format(rows=args.rows)
+
+    start = timeit.default_timer()
+    if mode == 'read_sql':
+        data = database_connection.get_data(query)
+    elif mode == 'arrow_pandas':
+        data = database_connection.get_data(query, use_arrow=True)
+    else:
+        data = database_connection.get_data(query, use_arrow=True, as_pyarrow=True)
+    elapsed = timeit.default_timer() - start
+
+    queue.put((mode, len(data), elapsed, peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--database', required=True)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--query', default=None)
+    args = parser.parse_args()
+
+    queue = mp.Queue()
+    print(f"{'mode':<14}{'rows':>12}{'seconds':>10}{'rows/s':>14}{'peak MB':>10}")
+    for mode in ['read_sql', 'arrow_pandas', 'arrow_table']:
+        process = mp.Process(target=run_mode, args=(mode, args, queue))
+        process.start()
+        process.join()
+        if process.exitcode:
+            print(f"{mode:<14} failed with exit code {process.exitcode}")
+            continue
+        mode, rows, elapsed, peak = queue.get()
+        print(f"{mode:<14}{rows:>12}{elapsed:>10.2f}{rows / elapsed:>14,.0f}{peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
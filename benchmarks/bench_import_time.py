@@ -0,0 +1,55 @@
+'''
+Import cost of the package: wall time of a fresh interpreter running each statement,
+and which heavy dependencies the statement pulls in.
+
+python benchmarks/bench_import_time.py --repeat 7
+'''
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import nurtelecom_gras_library',
+    'from nurtelecom_gras_library import send_msg_via_telegram',
+    'from nurtelecom_gras_library import OracleDataRetriever',
+    'from nurtelecom_gras_library import get_db_connection',
+    'from nurtelecom_gras_library import OracleGeoDataImporter',
+]
+HEAVY_MODULES = ['oracledb', 'pandas', 'sqlalchemy', 'pyarrow', 'geopandas', 'shapely',
+                 'tableauserverclient', 'hvac', 'requests']
+
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {heavy!r} if name in sys.modules]]))
+'''
+
+
+def measure(statement):
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'statement':<62}{'median ms':>10}  loaded")
+    for statement in STATEMENTS:
+        try:
+            runs = [measure(statement) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as e:
+            print(f"{statement:<62}  failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        median_ms = statistics.median(elapsed for elapsed, _ in runs) * 1000
+        print(f"{statement:<62}{median_ms:>10.1f}  {', '.join(runs[-1][1]) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
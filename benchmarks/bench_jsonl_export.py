@@ -0,0 +1,73 @@
+'''
+JSON-lines serialization throughput of export_to_file_oracle, without a database.
+
+Synthetic batches with Oracle-like values (NUMBER, VARCHAR2, DATE, TIMESTAMP,
+Decimal) are generated lazily and written to a temporary file by the legacy
+per-row json.dumps loop and by the stdlib / orjson batch encoders.
+
+python benchmarks/bench_jsonl_export.py --rows 10000000
+'''
+import argparse
+import datetime
+import decimal
+import json
+import os
+import tempfile
+import timeit
+
+from nurtelecom_gras_library.OracleDataRetriever import OracleDataRetriever
+
+COLUMN_NAMES = ['ID', 'MSISDN', 'REGION', 'REPORT_DATE', 'EVENT_TS', 'AMOUNT']
+
+
+def make_batches(rows, chunk_size):
+    base_date = datetime.datetime(2024, 1, 1)
+    for start in range(0, rows, chunk_size):
+        yield [
+            (i, 996700000000 + i, f'region_{i % 17}',
+             base_date + datetime.timedelta(days=i % 365),
+             base_date + datetime.timedelta(seconds=i),
+             decimal.Decimal(i % 100000) / 100)
+            for i in range(start, min(start + chunk_size, rows))
+        ]
+
+
+def legacy_serialize(rows):
+    # the pre-batch implementation, with default=str so it does not crash on dates
+    return ''.join(
+        json.dumps({COLUMN_NAMES[i]: value for i, value in enumerate(row)}, default=str) + '\n'
+        for row in rows)
+
+
+def run(name, serialize, rows, chunk_size, path):
+    start = timeit.default_timer()
+    with open(path, 'w', encoding='utf-8') as f:
+        for batch in make_batches(rows, chunk_size):
+            f.write(serialize(batch))
+    elapsed = timeit.default_timer() - start
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"{name:<10}{elapsed:>10.2f}{rows / elapsed:>14,.0f}{size_mb:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    args = parser.parse_args()
+
+    serializers = {'legacy': legacy_serialize}
+    for backend in ['json', 'orjson']:
+        try:
+            serializers[backend] = OracleDataRetriever._make_serializer(
+                COLUMN_NAMES, is_csv=False, sep=',', json_backend=backend)
+        except ImportError:
+            print(f"{backend} backend not installed, skipped")
+
+    print(f"{'encoder':<10}{'seconds':>10}{'rows/s':>14}{'file MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, serialize in serializers.items():
+            run(name, serialize, args.rows, args.chunk_size, os.path.join(tmp_dir, f'{name}.jsonl'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+'''
+Local stand-in for an Oracle database, used by the benchmark suite.
+
+FakeConnection/FakeCursor mimic the parts of the python-oracledb API the library
+uses and serve synthetic rows, sleeping per round trip for a configurable network
+latency and bandwidth. Methods that go through SQLAlchemy (pd.read_sql) run against
+an SQLite copy of the same rows instead, so they measure client-side cost without the
+latency model. The copy is built in memory unless write_sqlite_copy has prepared a file.
+
+retriever = make_retriever(rows=100_000, latency=0.002, bandwidth_mb=50)
+data = retriever.get_data('select * from bench_rows')
+'''
+import datetime
+import math
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from nurtelecom_gras_library.OracleDataRetriever import OracleDataRetriever
+
+COLUMN_NAMES = ['ID', 'MSISDN', 'REGION', 'REPORT_DATE', 'KPI_VALUE']
+GEOMETRY_COLUMN_NAMES = ['CELL_ID', 'GEOMETRY']
+
+
+def make_row(i, base_date=datetime.datetime(2024, 1, 1)):
+    return (i, 996700000000 + i, f'region_{i % 17}',
+            base_date + datetime.timedelta(days=i % 365), (i % 100000) / 100)
+
+
+def make_geometry_row(i):
+    # a small cell polygon around a point, as SDO_UTIL.TO_WKTGEOMETRY returns it
+    x, y = 74 + (i % 1000) / 1000, 42 + (i // 1000 % 1000) / 1000
+    return (i, f'POLYGON (({x} {y}, {x + 0.001} {y}, {x + 0.001} {y + 0.001}, {x} {y + 0.001}, {x} {y}))')
+
+
+def make_frame(rows):
+    return pd.DataFrame.from_records([make_row(i) for i in range(rows)],
+                                     columns=[name.lower() for name in COLUMN_NAMES])
+
+
+def make_geometry_frame(rows):
+    return pd.DataFrame.from_records([make_geometry_row(i) for i in range(rows)],
+                                     columns=[name.lower() for name in GEOMETRY_COLUMN_NAMES])
+
+
+def fill_sqlite(engine, rows, geometry=False):
+    if geometry:
+        make_geometry_frame(rows).to_sql('bench_geometries', engine, index=False, chunksize=50000)
+    else:
+        make_frame(rows).to_sql('bench_rows', engine, index=False, chunksize=50000)
+
+
+def write_sqlite_copy(path, rows, geometry=False):
+    'build the SQLite copy as a file, so a measured process can open it without building it'
+    engine = create_engine(f'sqlite:///{path}')
+    fill_sqlite(engine, rows, geometry)
+    engine.dispose()
+    return path
+
+
+class NetworkModel:
+    'sleeps for latency plus transfer time on every round trip'
+
+    def __init__(self, latency=0.002, bandwidth_mb=50.0):
+        self.latency = latency
+        self.bytes_per_second = bandwidth_mb * 1024 * 1024
+
+    def round_trip(self, payload_bytes=0, trips=1):
+        delay = trips * self.latency + payload_bytes / self.bytes_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.network = connection.network
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.rowcount = 0
+        self.description = None
+        self.outputtypehandler = None
+        self._rows = iter(())
+        self._batch_errors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            rows = self.fetchmany(self.arraysize)
+            if not rows:
+                return
+            yield from rows
+
+    def close(self):
+        self._rows = iter(())
+
+    def setinputsizes(self, *args, **kwargs):
+        pass
+
+    def execute(self, statement, parameters=None, **kwargs):
+        self.network.round_trip()
+        if 'bench_geometries' in statement.lower():
+            self.description = [(name,) for name in GEOMETRY_COLUMN_NAMES]
+            self._rows = (make_geometry_row(i) for i in range(self.connection.rows))
+        elif statement.lstrip().lower().startswith(('select', 'with')):
+            self.description = [(name,) for name in COLUMN_NAMES]
+            self._rows = (make_row(i) for i in range(self.connection.rows))
+        else:
+            self.description = None
+            self._rows = iter(())
+            self.rowcount = 1
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        rows = [row for _, row in zip(range(size), self._rows)]
+        self.network.round_trip(len(rows) * self.connection.row_bytes,
+                                trips=max(1, math.ceil(len(rows) / self.arraysize)))
+        return rows
+
+    def fetchall(self):
+        rows = []
+        while True:
+            batch = self.fetchmany(self.arraysize)
+            if not batch:
+                return rows
+            rows += batch
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if rows else (0,)
+
+    def executemany(self, statement, parameters, batcherrors=False, **kwargs):
+        self.network.round_trip(len(parameters) * self.connection.row_bytes)
+        self.rowcount = len(parameters)
+        self._batch_errors = []
+
+    def getbatcherrors(self):
+        return self._batch_errors
+
+
+class FakeConnection:
+
+    def __init__(self, network, rows, row_bytes):
+        self.network = network
+        self.rows = rows
+        self.row_bytes = row_bytes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.network.round_trip()
+
+    def rollback(self):
+        self.network.round_trip()
+
+    def fetch_df_batches(self, statement, parameters=None, size=100000):
+        import pyarrow as pa
+        cursor = self.cursor()
+        cursor.arraysize = size
+        cursor.execute(statement, parameters)
+        names = [col[0] for col in cursor.description]
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                return
+            yield pa.table({name: list(values) for name, values in zip(names, zip(*rows))})
+
+    def fetch_df_all(self, statement, parameters=None, arraysize=10000):
+        import pyarrow as pa
+        return pa.concat_tables(list(self.fetch_df_batches(statement, parameters, size=arraysize)))
+
+
+class FakeBackendMixin:
+    'routes get_connection to the fake driver and get_engine to an SQLite copy of the rows'
+
+    def use_fake_backend(self, rows, latency, bandwidth_mb, geometry=False, sqlite_path=None):
+        network = NetworkModel(latency, bandwidth_mb)
+        row_bytes = len(repr(make_geometry_row(0) if geometry else make_row(0)))
+        self._fake_connection = FakeConnection(network, rows, row_bytes)
+
+        engine = create_engine(f'sqlite:///{sqlite_path}' if sqlite_path else 'sqlite://', poolclass=StaticPool,
+                               connect_args={'check_same_thread': False})
+        if sqlite_path is None:
+            fill_sqlite(engine, rows, geometry)
+        self._engine = engine
+        return self
+
+    def get_connection(self):
+        return self._fake_connection
+
+
+class FakeOracleDataRetriever(FakeBackendMixin, OracleDataRetriever):
+    pass
+
+
+def make_retriever(rows, latency=0.002, bandwidth_mb=50.0, sqlite_path=None):
+    retriever = FakeOracleDataRetriever('bench', 'bench', 'localhost')
+    return retriever.use_fake_backend(rows, latency, bandwidth_mb, sqlite_path=sqlite_path)
+
+
+def make_geo_retriever(rows, latency=0.002, bandwidth_mb=50.0, sqlite_path=None):
+    from nurtelecom_gras_library.OracleGeoDataImporter import OracleGeoDataImporter
+
+    class FakeOracleGeoDataImporter(FakeBackendMixin, OracleGeoDataImporter):
+        pass
+
+    retriever = FakeOracleGeoDataImporter('bench', 'bench', 'localhost')
+    return retriever.use_fake_backend(rows, latency, bandwidth_mb, geometry=True, sqlite_path=sqlite_path)
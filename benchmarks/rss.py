@@ -0,0 +1,11 @@
+'''
+Peak resident memory of the current process, shared by the benchmark scripts.
+'''
+import resource
+import sys
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,146 @@
+'''
+Benchmark suite against a local Oracle stand-in (see fake_oracle.py), no database needed.
+
+Every case runs at every size in its own process, so the reported peak RSS belongs
+to that case alone. The SQLite copy and the upload input are written to files by a
+separate process beforehand (a forked child inherits its parent's peak); "setup MB" is
+the case process's peak after imports and loading them, and "case MB" is what the case
+itself added on top. The stand-in sleeps per round trip for
+--latency seconds plus the transfer time at --bandwidth-mb MB/s; cases that go through
+SQLAlchemy (get_data, export_to_file, geometry_parsing) read the SQLite copy instead.
+
+python benchmarks/run_benchmarks.py --sizes 10000 100000 1000000
+python benchmarks/run_benchmarks.py --cases get_data_arrow export_to_file_oracle_csv --latency 0.005
+'''
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import timeit
+
+from rss import peak_rss_mb
+
+QUERY = 'select * from bench_rows'
+
+
+def case_get_data(retriever, rows, tmp_dir):
+    return len(retriever.get_data(QUERY))
+
+
+def case_get_data_arrow(retriever, rows, tmp_dir):
+    return len(retriever.get_data(QUERY, use_arrow=True))
+
+
+def case_iter_data(retriever, rows, tmp_dir):
+    return sum(len(chunk) for chunk in retriever.iter_data(QUERY, chunk_rows=50000))
+
+
+def case_export_to_file(retriever, rows, tmp_dir):
+    retriever.export_to_file(QUERY, os.path.join(tmp_dir, 'export.csv'))
+    return rows
+
+
+def case_export_to_file_oracle_csv(retriever, rows, tmp_dir):
+    retriever.export_to_file_oracle(QUERY, os.path.join(tmp_dir, 'export.csv'), chunk_size=10000)
+    return rows
+
+
+def case_export_to_file_oracle_jsonl_gz(retriever, rows, tmp_dir):
+    retriever.export_to_file_oracle(QUERY, os.path.join(tmp_dir, 'export.jsonl.gz'), is_csv=False,
+                                    chunk_size=10000, pipelined=True)
+    return rows
+
+
+def case_export_to_file_oracle_parquet(retriever, rows, tmp_dir):
+    retriever.export_to_file_oracle(QUERY, os.path.join(tmp_dir, 'export.parquet'), file_format='parquet',
+                                    chunk_size=100000)
+    return rows
+
+
+def case_upload_pandas_df_to_oracle(retriever, rows, tmp_dir, frame=None):
+    return retriever.upload_pandas_df_to_oracle(frame, 'bench_rows', batch_size=15000)
+
+
+def case_upsert_from_pandas_df(retriever, rows, tmp_dir, frame=None):
+    retriever.upsert_from_pandas_df(frame, 'bench_rows', ['id'], batch_size=15000)
+    return rows
+
+
+def case_geometry_parsing(retriever, rows, tmp_dir):
+    return len(retriever.get_data('select * from bench_geometries', geom_columns_list=['geometry']))
+
+
+CASES = {name[len('case_'):]: function for name, function in globals().items() if name.startswith('case_')}
+NEEDS_FRAME = {'upload_pandas_df_to_oracle', 'upsert_from_pandas_df'}
+
+
+def fixture_paths(name, rows, fixture_dir):
+    sqlite_name = f"{'geometries' if name == 'geometry_parsing' else 'rows'}_{rows}.sqlite"
+    frame_path = os.path.join(fixture_dir, f'frame_{rows}.pkl') if name in NEEDS_FRAME else None
+    return os.path.join(fixture_dir, sqlite_name), frame_path
+
+
+def write_fixtures(name, rows, sqlite_path, frame_path):
+    'build the SQLite copy (and the upload input) once per size, outside the measured process'
+    import fake_oracle
+
+    if not os.path.exists(sqlite_path):
+        fake_oracle.write_sqlite_copy(sqlite_path, rows, geometry=name == 'geometry_parsing')
+    if frame_path and not os.path.exists(frame_path):
+        fake_oracle.make_frame(rows).to_pickle(frame_path)
+
+
+def run_case(name, rows, args, sqlite_path, frame_path, queue):
+    import logging
+    import fake_oracle
+
+    # keep the per-call metrics and progress output out of the report
+    logging.getLogger('nurtelecom_gras_library').setLevel(logging.WARNING)
+    sys.stdout = open(os.devnull, 'w')
+
+    if name == 'geometry_parsing':
+        retriever = fake_oracle.make_geo_retriever(rows, args.latency, args.bandwidth_mb, sqlite_path=sqlite_path)
+    else:
+        retriever = fake_oracle.make_retriever(rows, args.latency, args.bandwidth_mb, sqlite_path=sqlite_path)
+    kwargs = {'frame': fake_oracle.pd.read_pickle(frame_path)} if frame_path else {}
+    setup_peak = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = timeit.default_timer()
+        processed = CASES[name](retriever, rows, tmp_dir, **kwargs)
+        elapsed = timeit.default_timer() - start
+    queue.put((processed, elapsed, setup_peak, peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--latency', type=float, default=0.002, help='seconds per round trip')
+    parser.add_argument('--bandwidth-mb', type=float, default=50.0, help='MB/s between client and server')
+    args = parser.parse_args()
+
+    print(f"latency {args.latency * 1000:.1f} ms, bandwidth {args.bandwidth_mb:.0f} MB/s")
+    print(f"{'case':<38}{'rows':>10}{'seconds':>10}{'rows/s':>14}{'setup MB':>10}{'case MB':>10}")
+    queue = mp.Queue()
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        for name in args.cases:
+            for rows in args.sizes:
+                sqlite_path, frame_path = fixture_paths(name, rows, fixture_dir)
+                process = mp.Process(target=write_fixtures, args=(name, rows, sqlite_path, frame_path))
+                process.start()
+                process.join()
+                process = mp.Process(target=run_case, args=(name, rows, args, sqlite_path, frame_path, queue))
+                process.start()
+                process.join()
+                if process.exitcode:
+                    print(f"{name:<38}{rows:>10}  failed with exit code {process.exitcode}")
+                    continue
+                processed, elapsed, setup_peak, peak = queue.get()
+                print(f"{name:<38}{processed:>10}{elapsed:>10.2f}{processed / elapsed:>14,.0f}"
+                      f"{setup_peak:>10.0f}{peak - setup_peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import asyncio
+import oracledb
+import pandas as pd
+from nurtelecom_gras_library._batching import _iter_row_batches, _input_sizes_from_dtypes
+from nurtelecom_gras_library.MetricsRecorder import MetricsRecorder, record_call, fetch_timer, add_call_metrics
+
+
+class AsyncOracleDataRetriever():
+    """
+    asyncio counterpart of OracleDataRetriever built on python-oracledb async
+    connections. All sessions come from one AsyncConnectionPool, so many concurrent
+    requests share a small pool without a thread per request.
+
+    Note: the driver supports asyncio only in thin mode, so do not use thick-mode
+    OracleDataRetriever connections in the same process (see thin_mode there).
+
+    Usage:
+    database_connector = get_db_connection('login', 'database', asynchronous=True)
+    data = await database_connector.get_data(query)
+    await database_connector.close_pool()
+    """
+
+    def __init__(self, user: str, password: str, host: str,
+                 port: str = '1521', service_name: str = 'DWH',
+                 use_pool: bool = True, pool_min: int = 1, pool_max: int = 4,
+                 pool_increment: int = 1, pool_ping_interval: int = 60,
+                 stmtcachesize: int = 50, metrics: MetricsRecorder = None) -> None:
+        """
+        Same arguments as OracleDataRetriever; use_pool is accepted for compatibility,
+        async connections are always pooled.
+        """
+        self.host = host
+        self.port = port
+        self.service_name = service_name
+        self.user = user
+        self.password = password
+        self.dsn = oracledb.makedsn(self.host, self.port, service_name=self.service_name)
+
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.pool_increment = pool_increment
+        self.pool_ping_interval = pool_ping_interval
+        self.stmtcachesize = stmtcachesize
+        self._pool = None
+        self.metrics = metrics or MetricsRecorder()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close_pool()
+
+    def get_pool(self):
+        """
+        Creates (once) and returns the async session pool shared by all methods.
+        """
+        if self._pool is None:
+            try:
+                self._pool = oracledb.create_pool_async(
+                    user=self.user, password=self.password, dsn=self.dsn,
+                    min=self.pool_min, max=self.pool_max,
+                    increment=self.pool_increment,
+                    ping_interval=self.pool_ping_interval,
+                    stmtcachesize=self.stmtcachesize,
+                    getmode=oracledb.POOL_GETMODE_WAIT)
+            except Exception as e:
+                print(f"Error creating pool: {e}")
+                raise
+        return self._pool
+
+    def get_connection(self):
+        """
+        Returns an async connection from the pool.
+
+        Usage:
+        async with database_connector.get_connection() as conn:
+            # Perform database operations
+        """
+        return self.get_pool().acquire()
+
+    def pool_statistics(self) -> dict:
+        'current sizing of the session pool; empty dict if the pool has not been created'
+        if self._pool is None:
+            return {}
+        return {
+            'opened': self._pool.opened,
+            'busy': self._pool.busy,
+            'idle': self._pool.opened - self._pool.busy,
+            'min': self._pool.min,
+            'max': self._pool.max,
+            'increment': self._pool.increment,
+        }
+
+    async def close_pool(self, force: bool = False) -> None:
+        if self._pool is not None:
+            await self._pool.close(force=force)
+            self._pool = None
+
+    @record_call
+    async def get_data(self, query: str, remove_column=None, remove_na: bool = False,
+                       show_logs: bool = False, use_arrow: bool = False,
+                       arraysize: int = 10000, params=None) -> pd.DataFrame:
+        """
+        Retrieve data from the database based on a SQL query.
+
+        :param query: SQL query for data retrieval
+        :param remove_column: Columns to remove from the resulting DataFrame, defaults to None
+        :param remove_na: Flag to indicate if NA values should be dropped, defaults to False
+        :param show_logs: Flag to indicate if logs should be shown, defaults to False
+        :param use_arrow: Flag to fetch through the driver's Arrow interface, defaults to False
+        :param arraysize: Rows fetched per round trip, defaults to 10000
+        :param params: Bind values for the placeholders in query, defaults to None
+        :return: pandas DataFrame containing the retrieved data
+        """
+        remove_column = remove_column or []
+        try:
+            async with self.get_connection() as conn:
+                if use_arrow:
+                    import pyarrow as pa
+                    with fetch_timer():
+                        odf = await conn.fetch_df_all(statement=query, parameters=params, arraysize=arraysize)
+                    data = pa.table(odf).to_pandas()
+                else:
+                    cursor = conn.cursor()
+                    cursor.arraysize = arraysize
+                    with fetch_timer() as timer:
+                        await cursor.execute(query, params, fetch_lobs=False)
+                        rows = await cursor.fetchall()
+                        timer.round_trips = 1 + len(rows) // arraysize
+                    column_names = [col[0] for col in cursor.description]
+                    data = pd.DataFrame.from_records(rows, columns=column_names)
+
+            data.columns = data.columns.str.lower()
+            if remove_column:
+                data.drop(columns=remove_column, inplace=True)
+            if remove_na:
+                data.dropna(inplace=True)
+
+            if show_logs:
+                print(data.head(5))
+            return data
+
+        except Exception as e:
+            print(f"Error during data retrieval: {e}")
+            raise
+
+    @record_call
+    async def iter_data(self, query: str, chunk_rows: int = 100000, arraysize: int = 10000,
+                        prefetchrows: int = None, remove_column=None, remove_na: bool = False,
+                        params=None, fetch_lobs: bool = False):
+        """
+        Async generator of pandas DataFrame chunks read from a single cursor.
+
+        Usage:
+        async for chunk in database_connector.iter_data(query, chunk_rows=200000):
+            # aggregate or forward the chunk
+        """
+        remove_column = remove_column or []
+        async with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = arraysize
+            if prefetchrows is not None:
+                cursor.prefetchrows = prefetchrows
+            with fetch_timer():
+                await cursor.execute(query, params, fetch_lobs=fetch_lobs)
+            column_names = [col[0].lower() for col in cursor.description]
+            while True:
+                with fetch_timer():
+                    rows = await cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                chunk = pd.DataFrame.from_records(rows, columns=column_names)
+                if remove_column:
+                    chunk.drop(columns=remove_column, inplace=True)
+                if remove_na:
+                    chunk.dropna(inplace=True)
+                add_call_metrics(rows=len(chunk), batches=1)
+                yield chunk
+
+    @record_call
+    async def execute(self, query: str, verbose: bool = False, commit: bool = True,
+                      params=None) -> None:
+        """
+        Execute a SQL statement or PL/SQL block.
+
+        :param commit: Flag to commit after the statement, defaults to True
+        :param params: Bind values for the placeholders in query, defaults to None
+        """
+        try:
+            async with self.get_connection() as conn:
+                cursor = conn.cursor()
+                with fetch_timer(round_trips=1 + commit):
+                    await cursor.execute(query, params)
+                    if commit:
+                        await conn.commit()
+            if verbose:
+                print('Query executed successfully.')
+
+        except Exception as e:
+            if verbose:
+                print(f'Error during query execution: {e}')
+            raise
+
+    @record_call
+    async def upload_pandas_df_to_oracle(self, pandas_df: pd.DataFrame, table_name: str,
+                                         geometry_cols: list = [], srid: int = 4326,
+                                         batch_size: int = 15000) -> int:
+        """
+        Uploads a pandas DataFrame to an Oracle table using bulk insert.
+
+        :param pandas_df: DataFrame to upload
+        :param table_name: Target Oracle table name
+        :param geometry_cols: List of geometry columns to handle with SDO_GEOMETRY
+        :param srid: Spatial Reference ID for geometry columns
+        :param batch_size: Number of rows sent per executemany call, defaults to 15000
+        :return: number of inserted rows
+        """
+        values_string = ', '.join(
+            f"SDO_GEOMETRY(:{i}, {srid})" if col in geometry_cols else f":{i}"
+            for i, col in enumerate(pandas_df.columns, start=1))
+        sql_text = f"INSERT INTO {table_name} VALUES ({values_string})"
+
+        try:
+            async with self.get_connection() as oracle_conn:
+                oracle_cursor = oracle_conn.cursor()
+                oracle_cursor.setinputsizes(
+                    *_input_sizes_from_dtypes(pandas_df, geometry_cols))
+                row_count = 0
+                for batch in _iter_row_batches(pandas_df, batch_size, geometry_cols):
+                    with fetch_timer():
+                        await oracle_cursor.executemany(sql_text, batch)
+                    row_count += oracle_cursor.rowcount
+                    add_call_metrics(batches=1)
+                    # building the next batch is CPU work; let other tasks run in between
+                    await asyncio.sleep(0)
+                await oracle_conn.commit()
+            print(f'Number of new added rows in "{table_name}": {row_count}')
+            return row_count
+
+        except oracledb.DatabaseError as e:
+            print('Error during insertion:', e)
+            raise
+
+
+if __name__ == "__main__":
+    pass
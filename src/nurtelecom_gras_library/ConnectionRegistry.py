@@ -0,0 +1,94 @@
+import time
+import functools
+import threading
+from nurtelecom_gras_library.additional_functions import get_all_cred_dict
+
+
+class ConnectionRegistry:
+    """
+    Process-wide cache of Vault credentials and database connection objects.
+
+    Credentials are read from Vault once and reused for secret_ttl seconds. Connections
+    created here get a password_provider that re-reads Vault when the database rejects
+    the login, so a rotated password is picked up without restarting the job.
+    get_connection returns one pooled retriever per (user, database, geodata).
+
+    Usage:
+    registry = ConnectionRegistry(secret_ttl=600)
+    database_connector = registry.get_connection('login', 'database')
+    data = database_connector.get_data(query)
+    registry.close()
+    """
+
+    def __init__(self, secret_ttl: float = 300, credentials_loader=None) -> None:
+        """
+        :param secret_ttl: Seconds the Vault secrets are reused before being read again, defaults to 300
+        :param credentials_loader: Callable returning the credentials dict, defaults to get_all_cred_dict
+        """
+        self.secret_ttl = secret_ttl
+        self.credentials_loader = credentials_loader or get_all_cred_dict
+        self._credentials = None
+        self._loaded_at = None
+        self._connections = {}
+        self._lock = threading.RLock()
+
+    def get_credentials(self, refresh: bool = False) -> dict:
+        """
+        Returns the cached credentials dict, reading Vault when it is older than secret_ttl.
+
+        :param refresh: Flag to read Vault even if the cached secrets are still fresh, defaults to False
+        """
+        with self._lock:
+            expired = self._loaded_at is None or time.monotonic() - self._loaded_at > self.secret_ttl
+            if refresh or expired:
+                credentials = self.credentials_loader()
+                if credentials is None:
+                    raise ValueError("Vault did not authenticate the token, no credentials were read.")
+                self._credentials = credentials
+                self._loaded_at = time.monotonic()
+            return self._credentials
+
+    def current_password(self, user: str, database: str) -> str:
+        'password_provider for connections: re-reads Vault and returns the password for user/database'
+        return self.get_credentials(refresh=True).get(f'{user.upper()}_{database.upper()}')
+
+    def password_provider(self, user: str, database: str):
+        return functools.partial(self.current_password, user, database)
+
+    def get_connection(self, user: str, database: str, geodata: bool = False, **kwargs):
+        """
+        Returns the registered connection for (user, database, geodata), creating it on first use.
+
+        Extra keyword arguments are passed to get_db_connection when the connection is created;
+        use_pool defaults to True. Later calls for the same key return the same object and
+        ignore their keyword arguments.
+        """
+        from nurtelecom_gras_library.updated_connection import get_db_connection
+        key = (user.upper(), database.upper(), geodata)
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is None:
+                kwargs.setdefault('use_pool', True)
+                kwargs.setdefault('password_provider', self.password_provider(user, database))
+                connection = get_db_connection(user, database, all_cred_dict=self.get_credentials(),
+                                               geodata=geodata, **kwargs)
+                self._connections[key] = connection
+            elif kwargs:
+                print(f"Warning: connection for {key} already exists, ignoring {sorted(kwargs)}.")
+            return connection
+
+    def close(self, force: bool = False) -> None:
+        """
+        Closes the pools of all registered connections and forgets them; cached credentials are kept.
+
+        :param force: Flag to close pools even if sessions are still in use, defaults to False
+        """
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            connection.close_pool(force=force)
+
+
+if __name__ == "__main__":
+    pass
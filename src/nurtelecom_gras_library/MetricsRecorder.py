@@ -0,0 +1,252 @@
+import time
+import inspect
+import logging
+import datetime
+import functools
+import threading
+import contextvars
+from collections import deque, defaultdict
+
+logger = logging.getLogger('nurtelecom_gras_library.metrics')
+
+# record of the client call running in the current context, filled by add_call_metrics
+_current_call = contextvars.ContextVar('gras_current_call', default=None)
+_counter_lock = threading.Lock()
+
+
+class MetricsRecorder:
+    """
+    Collects one metrics record per client call (see record_call) and emits it through
+    logging (logger "nurtelecom_gras_library.metrics", INFO, record in extra['metrics']),
+    the registered callbacks (e.g. PrometheusTextFileExporter) and a bounded in-memory history.
+
+    Record fields: client, method, status ('ok'/'error'), error, started_at, wall_time,
+    fetch_time (time spent in driver calls: execute, fetch, executemany, commit),
+    process_time (wall_time - fetch_time), rows, bytes, round_trips (driver calls, a lower
+    bound on network round trips) and batches.
+
+    Usage:
+    metrics = MetricsRecorder(callbacks=[PrometheusTextFileExporter('/var/lib/node_exporter/gras.prom')])
+    database_connector = get_db_connection('login', 'database', metrics=metrics)
+    database_connector.get_data(query)
+    print(metrics.summary())
+    """
+
+    def __init__(self, callbacks: list = None, log_level: int = logging.INFO, history_size: int = 1000) -> None:
+        self.callbacks = list(callbacks or [])
+        self.log_level = log_level
+        self.history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback) -> None:
+        'callback(record) is called after every recorded call'
+        self.callbacks.append(callback)
+
+    def emit(self, record: dict) -> None:
+        with self._lock:
+            self.history.append(record)
+        logger.log(
+            self.log_level,
+            "%s.%s %s in %.2fs (fetch %.2fs, process %.2fs): %d rows, %.1f MB, %d round trips, %d batches",
+            record['client'], record['method'], record['status'], record['wall_time'],
+            record['fetch_time'], record['process_time'], record['rows'], record['bytes'] / 1024 / 1024,
+            record['round_trips'], record['batches'], extra={'metrics': record})
+        for callback in self.callbacks:
+            try:
+                callback(record)
+            except Exception as e:
+                # a failing exporter must not fail the job
+                logger.warning("metrics callback %r failed: %s", callback, e)
+
+    def summary(self) -> dict:
+        """
+        Totals per "client.method" over the history: calls, errors, wall_time, fetch_time, rows, bytes.
+        """
+        totals = defaultdict(lambda: {'calls': 0, 'errors': 0, 'wall_time': 0.0, 'fetch_time': 0.0,
+                                      'rows': 0, 'bytes': 0})
+        with self._lock:
+            records = list(self.history)
+        for record in records:
+            total = totals[f"{record['client']}.{record['method']}"]
+            total['calls'] += 1
+            total['errors'] += record['status'] != 'ok'
+            for field in ('wall_time', 'fetch_time', 'rows', 'bytes'):
+                total[field] += record[field]
+        return dict(totals)
+
+
+def add_call_metrics(**counts) -> None:
+    """
+    Add to the counters (rows, bytes, round_trips, batches, fetch_time) of the call
+    running in this context; a no-op outside a recorded call.
+    """
+    call = _current_call.get()
+    if call is None:
+        return
+    with _counter_lock:
+        for name, value in counts.items():
+            call[name] += value
+
+
+class fetch_timer:
+    """
+    Context manager counting the enclosed driver call as fetch time and round trips.
+
+    with fetch_timer():
+        rows = cursor.fetchmany(chunk_size)
+    """
+
+    def __init__(self, round_trips: int = 1) -> None:
+        self.round_trips = round_trips
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        add_call_metrics(fetch_time=time.perf_counter() - self.start, round_trips=self.round_trips)
+
+
+def timed_iter(iterable):
+    'iterate, counting the time to produce each item (e.g. a driver batch) as fetch time'
+    iterator = iter(iterable)
+    while True:
+        with fetch_timer():
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def _start_call(client, method_name):
+    return {
+        'client': type(client).__name__, 'method': method_name, 'status': 'ok', 'error': None,
+        'started_at': datetime.datetime.now().isoformat(), 'wall_time': 0.0, 'process_time': 0.0,
+        'rows': 0, 'bytes': 0, 'round_trips': 0, 'batches': 0, 'fetch_time': 0.0,
+        '_start': time.perf_counter(), '_parent': _current_call.get(),
+    }
+
+
+def _finish_call(client, call, result=None, error=None):
+    call['wall_time'] = time.perf_counter() - call.pop('_start')
+    call['process_time'] = max(0.0, call['wall_time'] - call['fetch_time'])
+    parent = call.pop('_parent')
+    if parent is not None:
+        # driver time of nested calls (e.g. get_data slices of get_data_parallel) rolls up
+        with _counter_lock:
+            for name in ('fetch_time', 'round_trips', 'batches'):
+                parent[name] += call[name]
+    if error is not None:
+        call['status'] = 'error'
+        call['error'] = repr(error)
+    elif not call['rows']:
+        # fall back to the size of the returned data
+        if hasattr(result, 'num_rows'):
+            call['rows'], call['bytes'] = result.num_rows, call['bytes'] or result.nbytes
+        elif hasattr(result, 'memory_usage'):
+            call['rows'] = len(result)
+            call['bytes'] = call['bytes'] or int(result.memory_usage(index=False).sum())
+        elif isinstance(result, dict) and isinstance(result.get('rows'), int):
+            call['rows'] = result['rows']
+        elif isinstance(result, int) and not isinstance(result, bool):
+            call['rows'] = result
+    metrics = getattr(client, 'metrics', None)
+    if metrics is not None:
+        metrics.emit(call)
+
+
+def record_call(method):
+    """
+    Decorator for client methods: records one metrics record per call and emits it through
+    the client's `metrics` recorder. Handles plain, generator, coroutine and async generator
+    methods; for generators the wall time runs from the first item to exhaustion.
+    """
+    if inspect.isasyncgenfunction(method):
+        @functools.wraps(method)
+        async def async_gen_wrapper(self, *args, **kwargs):
+            call = _start_call(self, method.__name__)
+            generator = method(self, *args, **kwargs)
+            error = None
+            try:
+                while True:
+                    token = _current_call.set(call)
+                    try:
+                        item = await generator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        _current_call.reset(token)
+                    yield item
+            except GeneratorExit:
+                # consumer stopped early, not a failure
+                raise
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                await generator.aclose()
+                _finish_call(self, call, error=error)
+        return async_gen_wrapper
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            call = _start_call(self, method.__name__)
+            token = _current_call.set(call)
+            try:
+                result = await method(self, *args, **kwargs)
+            except BaseException as e:
+                _finish_call(self, call, error=e)
+                raise
+            finally:
+                _current_call.reset(token)
+            _finish_call(self, call, result)
+            return result
+        return async_wrapper
+
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def gen_wrapper(self, *args, **kwargs):
+            call = _start_call(self, method.__name__)
+            generator = method(self, *args, **kwargs)
+            error = None
+            try:
+                while True:
+                    token = _current_call.set(call)
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        break
+                    finally:
+                        _current_call.reset(token)
+                    yield item
+            except GeneratorExit:
+                # consumer stopped early, not a failure
+                raise
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                generator.close()
+                _finish_call(self, call, error=error)
+        return gen_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        call = _start_call(self, method.__name__)
+        token = _current_call.set(call)
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            _finish_call(self, call, error=e)
+            raise
+        finally:
+            _current_call.reset(token)
+        _finish_call(self, call, result)
+        return result
+    return wrapper
+
+
+if __name__ == "__main__":
+    pass
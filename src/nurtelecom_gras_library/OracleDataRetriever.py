@@ -2,18 +2,131 @@
 import oracledb
 import pandas as pd
 import timeit
-from sqlalchemy.engine import create_engine
-from sqlalchemy import update, text
-from nurtelecom_gras_library.additional_functions import measure_time
+from nurtelecom_gras_library.additional_functions import infer_oracle_types, make_table_query_from_pandas
+from nurtelecom_gras_library.QueryResultCache import QueryResultCache
+from nurtelecom_gras_library._batching import _iter_row_batches, _input_sizes_from_dtypes
+from nurtelecom_gras_library.MetricsRecorder import (
+    MetricsRecorder, record_call, fetch_timer, timed_iter, add_call_metrics)
 import csv
+import codecs
 import json
+import datetime
+import decimal
+import threading
+import time
+import hashlib
+import uuid
+import queue
+import io
+import gzip
+import os
+import shutil
+import math
+import re
+import itertools
+import logging
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# data files written by sync_to_parquet: gras-sync-<run_id>-<batch>[-<i>].parquet
+SYNC_FILE_PATTERN = re.compile(r'^gras-sync-(\d{8}T\d{6}[0-9a-f]{8})-\d{5}(-\d+)?\.parquet$')
+
+
+def _json_default(value):
+    'convert Oracle values the json encoders do not know natively'
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, oracledb.LOB):
+        return value.read()
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# ORA-03113/03114/03135 (lost contact), ORA-12170/12537/12547 (network), ORA-25408 (failover)
+TRANSIENT_ORA_CODES = {3113, 3114, 3135, 12170, 12537, 12547, 25408}
+
+
+def _is_transient_error(exception):
+    'True for errors after which a new session can simply retry the work'
+    if not isinstance(exception, (oracledb.DatabaseError, oracledb.InterfaceError)):
+        return False
+    error, = exception.args
+    return (getattr(error, 'isrecoverable', False) or getattr(error, 'is_session_dead', False)
+            or getattr(error, 'code', None) in TRANSIENT_ORA_CODES)
+
+
+# ORA-01017 (invalid username/password), ORA-28001 (password expired)
+AUTH_ORA_CODES = {1017, 28001}
+
+
+def _is_auth_error(exception):
+    'True for a rejected login, after which a renewed password may succeed'
+    if not isinstance(exception, oracledb.DatabaseError):
+        return False
+    error, = exception.args
+    return getattr(error, 'code', None) in AUTH_ORA_CODES
+
+
+_client_lock = threading.Lock()
+_client_initialized = False
+
+
+def init_oracle_client(thin_mode: bool = False, **kwargs) -> bool:
+    """
+    Select the python-oracledb mode for this process on first use; later calls are no-ops,
+    since the mode cannot change once a connection exists.
+
+    Thick mode loads Oracle Instant Client through oracledb.init_oracle_client(**kwargs)
+    (lib_dir, config_dir, ...); thin mode needs no client libraries.
+
+    :param thin_mode: Flag to stay in thin mode, defaults to False (thick)
+    :return: True if the process runs in thin mode
+    """
+    global _client_initialized
+    if not _client_initialized:
+        with _client_lock:
+            if not _client_initialized:
+                if not thin_mode:
+                    oracledb.init_oracle_client(**kwargs)
+                _client_initialized = True
+    if thin_mode != oracledb.is_thin_mode():
+        print(f"Warning: {'thin' if thin_mode else 'thick'} mode requested, but this process already "
+              f"runs in {'thin' if oracledb.is_thin_mode() else 'thick'} mode.")
+    return oracledb.is_thin_mode()
 
 
 class OracleDataRetriever():
-    oracledb.init_oracle_client()
 
     def __init__(self, user: str, password: str, host: str,
-                 port: str = '1521', service_name: str = 'DWH') -> None:
+                 port: str = '1521', service_name: str = 'DWH',
+                 use_pool: bool = False, pool_min: int = 1, pool_max: int = 4,
+                 pool_increment: int = 1, pool_ping_interval: int = 60,
+                 stmtcachesize: int = 50, metrics: MetricsRecorder = None,
+                 thin_mode: bool = None, password_provider=None) -> None:
+        """
+        :param use_pool: Flag to share one oracledb session pool between all methods, defaults to False
+        :param pool_min: Number of sessions opened when the pool is created, defaults to 1
+        :param pool_max: Maximum number of sessions in the pool, defaults to 4
+        :param pool_increment: Number of sessions opened when the pool grows, defaults to 1
+        :param pool_ping_interval: Seconds a session may stay idle before it is pinged on acquire, defaults to 60
+        :param stmtcachesize: Number of parsed statements cached per session, so repeated
+            parameterized queries reuse their cursors, defaults to 50
+        :param metrics: MetricsRecorder receiving one record (time, rows, bytes, round trips) per call,
+            defaults to a recorder that emits through the "nurtelecom_gras_library.metrics" logger
+        :param thin_mode: Flag to use the driver's thin mode (no Instant Client), defaults to the
+            GRAS_ORACLE_THIN_MODE environment variable ('1'/'true'), otherwise thick mode. The client
+            is initialized on the first connection, not at import.
+        :param password_provider: Callable returning the current password, called when the database
+            rejects the login (ORA-01017/ORA-28001, e.g. after a Vault rotation) before one retry,
+            defaults to None (no retry)
+        """
         self.host = host
         self.port = port
         self.service_name = service_name
@@ -24,6 +137,145 @@ class OracleDataRetriever():
         
         self.ENGINE_PATH_WIN_AUTH = f'oracle://{self.user}:{self.password}@(DESCRIPTION=(ADDRESS=(PROTOCOL=TCP)(HOST={self.host})(PORT={self.port}))(CONNECT_DATA=(SERVICE_NAME={self.service_name})))'
 
+        self.use_pool = use_pool
+        self.pool_min = pool_min
+        self.pool_max = pool_max
+        self.pool_increment = pool_increment
+        self.pool_ping_interval = pool_ping_interval
+        self.stmtcachesize = stmtcachesize
+        self._pool = None
+        self._lock = threading.RLock()
+        self.cache = None
+        self.metrics = metrics or MetricsRecorder()
+        if thin_mode is None:
+            thin_mode = os.environ.get('GRAS_ORACLE_THIN_MODE', '').lower() in ('1', 'true', 'yes')
+        self.thin_mode = thin_mode
+        self.password_provider = password_provider
+
+    def enable_cache(self, cache: QueryResultCache = None, cache_dir: str = None,
+                     max_size_mb: float = 1024, default_ttl: float = 3600) -> QueryResultCache:
+        """
+        Attach an on-disk result cache used by get_data(..., use_cache=True).
+        Pass an existing QueryResultCache to share it between connections, or a cache_dir to create one.
+        """
+        if cache is None:
+            if cache_dir is None:
+                raise ValueError("Either 'cache' or 'cache_dir' must be provided.")
+            cache = QueryResultCache(cache_dir, max_size_mb=max_size_mb, default_ttl=default_ttl)
+        self.cache = cache
+        return cache
+
+    def get_pool(self):
+        """
+        Creates (once) and returns the oracledb session pool shared by all methods.
+
+        The pool is thread-safe: every call acquires its own session and
+        releases it back to the pool when the connection is closed.
+        """
+        if self._pool is None:
+            init_oracle_client(self.thin_mode)
+            with self._lock:
+                if self._pool is None:
+                    try:
+                        self._pool = oracledb.create_pool(
+                            user=self.user, password=self.password, dsn=self.dsn,
+                            min=self.pool_min, max=self.pool_max,
+                            increment=self.pool_increment,
+                            ping_interval=self.pool_ping_interval,
+                            stmtcachesize=self.stmtcachesize,
+                            getmode=oracledb.POOL_GETMODE_WAIT)
+                    except Exception as e:
+                        print(f"Error creating pool: {e}")
+                        raise
+        return self._pool
+
+    def get_connection(self):
+        """
+        Returns an oracledb connection, acquired from the session pool when
+        use_pool is set, otherwise a new standalone connection.
+
+        Usage:
+        with database_connector.get_connection() as conn:
+            # Perform database operations
+        """
+        failed_password = self.password
+        try:
+            return self._connect()
+        except oracledb.DatabaseError as e:
+            if self.password_provider is None or not _is_auth_error(e) or not self.renew_password(failed_password):
+                raise
+            return self._connect()
+
+    def _connect(self):
+        if self.use_pool:
+            return self.get_pool().acquire()
+        init_oracle_client(self.thin_mode)
+        return oracledb.connect(user=self.user, password=self.password, dsn=self.dsn,
+                                stmtcachesize=self.stmtcachesize)
+
+    def renew_password(self, failed_password: str = None) -> bool:
+        """
+        Asks password_provider for the current password and switches new sessions to it.
+        The session pool is replaced; sessions already checked out keep working.
+
+        :param failed_password: Password the database just rejected; if another thread has
+            already replaced it, nothing is fetched, defaults to the current password
+        :return: True if a different password is now in use
+        """
+        if self.password_provider is None:
+            return False
+        with self._lock:
+            if failed_password is not None and failed_password != self.password:
+                return True
+            password = self.password_provider()
+            if not password or password == self.password:
+                return False
+            print(f"Password for {self.user} renewed, reconnecting.")
+            self.password = password
+            self.engine_url = f'oracle+oracledb://{self.user}:{self.password}@{self.dsn}'
+            self.ENGINE_PATH_WIN_AUTH = f'oracle://{self.user}:{self.password}@(DESCRIPTION=(ADDRESS=(PROTOCOL=TCP)(HOST={self.host})(PORT={self.port}))(CONNECT_DATA=(SERVICE_NAME={self.service_name})))'
+            old_pool, self._pool = self._pool, None
+        if old_pool is not None:
+            try:
+                old_pool.close()
+            except Exception as e:
+                # busy sessions are closed when they are released and the pool is collected
+                print(f"Previous pool left open: {e}")
+        return True
+
+    def pool_statistics(self) -> dict:
+        """
+        Returns the current sizing of the session pool, useful to tune
+        pool_min/pool_max under load. Returns an empty dict if the pool has not been created.
+        """
+        if self._pool is None:
+            return {}
+        return {
+            'opened': self._pool.opened,
+            'busy': self._pool.busy,
+            'idle': self._pool.opened - self._pool.busy,
+            'min': self._pool.min,
+            'max': self._pool.max,
+            'increment': self._pool.increment,
+            'ping_interval': self._pool.ping_interval,
+            'wait_timeout': self._pool.wait_timeout,
+            'stmtcachesize': self._pool.stmtcachesize,
+        }
+
+    def close_pool(self, force: bool = False) -> None:
+        """
+        Closes the session pool and disposes the SQLAlchemy engine built on top of it.
+
+        :param force: Flag to close the pool even if sessions are still in use, defaults to False
+        """
+        with self._lock:
+            if hasattr(self, '_engine'):
+                self._engine.dispose()
+                del self._engine
+            if self._pool is not None:
+                self._pool.close(force=force)
+                self._pool = None
+
     def get_engine(self):
         """
         Creates and returns a SQLAlchemy engine for database connections.
@@ -37,16 +289,32 @@ class OracleDataRetriever():
         Note: Remember to close the connection after use.
         """
         if not hasattr(self, '_engine'):
-            try:
-                # self._engine = create_engine(self.ENGINE_PATH_WIN_AUTH)
-                self._engine = create_engine(
-                    self.engine_url, echo=False, future=True)
-            except Exception as e:
-                print(f"Error creating engine: {e}")
-                raise
+            from sqlalchemy import create_engine
+            from sqlalchemy.pool import NullPool
+            init_oracle_client(self.thin_mode)
+            with self._lock:
+                if not hasattr(self, '_engine'):
+                    try:
+                        # self._engine = create_engine(self.ENGINE_PATH_WIN_AUTH)
+                        # sessions come from get_connection, so a renewed password applies to the engine too
+                        if self.use_pool:
+                            # sessions come from the oracledb pool, so SQLAlchemy must not pool them again
+                            self._engine = create_engine(
+                                'oracle+oracledb://', creator=self.get_connection,
+                                poolclass=NullPool, echo=False, future=True)
+                        else:
+                            self._engine = create_engine(
+                                'oracle+oracledb://', creator=self.get_connection, echo=False, future=True)
+                    except Exception as e:
+                        print(f"Error creating engine: {e}")
+                        raise
         return self._engine
 
-    def get_data(self, query: str, remove_column=None, remove_na: bool = False, show_logs: bool = False) -> pd.DataFrame:
+    @record_call
+    def get_data(self, query: str, remove_column=None, remove_na: bool = False, show_logs: bool = False,
+                 params=None, use_arrow: bool = False, as_pyarrow: bool = False, arraysize: int = 10000,
+                 use_cache: bool = False, cache_ttl: float = None, typed: bool = False,
+                 category_threshold: float = 0.5, memory_report: bool = False):
         """
         Retrieve data from the database based on a SQL query.
 
@@ -54,15 +322,55 @@ class OracleDataRetriever():
         :param remove_column: Columns to remove from the resulting DataFrame, defaults to None
         :param remove_na: Flag to indicate if NA values should be dropped, defaults to False
         :param show_logs: Flag to indicate if logs should be shown, defaults to False
-        :return: pandas DataFrame containing the retrieved data
+        :param params: Bind values for the :name placeholders in query (dict), defaults to None.
+            Prefer binds over f-strings: the statement is parsed once and reused from the cache.
+        :param use_arrow: Flag to fetch through the driver's columnar (Arrow) interface
+            instead of SQLAlchemy and pd.read_sql, defaults to False. Requires pyarrow.
+        :param as_pyarrow: Flag to return a pyarrow.Table instead of a pandas DataFrame
+            (only with use_arrow), defaults to False
+        :param arraysize: Rows fetched per round trip in the Arrow path, defaults to 10000
+        :param use_cache: Flag to serve the result from the cache attached with enable_cache, defaults to False
+        :param cache_ttl: Seconds the cached result stays valid, defaults to the cache's default_ttl
+        :param typed: Flag to choose dtypes from the cursor metadata: NUMBER(p,0) as nullable
+            Int16/Int32/Int64, DATE/TIMESTAMP as datetime64 and low-cardinality VARCHAR2 as category,
+            defaults to False
+        :param category_threshold: Max ratio of distinct values to rows for a string column to
+            become category (typed only), defaults to 0.5
+        :param memory_report: Flag to print per-column dtype and memory before/after typing (typed only),
+            defaults to False
+        :return: pandas DataFrame (or pyarrow.Table) containing the retrieved data
         """
+        return self._get_data_impl(query, remove_column=remove_column, remove_na=remove_na, show_logs=show_logs,
+                                   params=params, use_arrow=use_arrow, as_pyarrow=as_pyarrow, arraysize=arraysize,
+                                   use_cache=use_cache, cache_ttl=cache_ttl, typed=typed,
+                                   category_threshold=category_threshold, memory_report=memory_report)
+
+    def _get_data_impl(self, query: str, remove_column=None, remove_na: bool = False, show_logs: bool = False,
+                       params=None, use_arrow: bool = False, as_pyarrow: bool = False, arraysize: int = 10000,
+                       use_cache: bool = False, cache_ttl: float = None, typed: bool = False,
+                       category_threshold: float = 0.5, memory_report: bool = False):
+        'get_data without a metrics record of its own, for lookups made inside another recorded call'
         remove_column = remove_column or []
+        if use_cache:
+            return self._get_data_cached(query, params=params, remove_column=remove_column, remove_na=remove_na,
+                                         show_logs=show_logs, use_arrow=use_arrow, as_pyarrow=as_pyarrow,
+                                         arraysize=arraysize, cache_ttl=cache_ttl, typed=typed,
+                                         category_threshold=category_threshold, memory_report=memory_report)
+        if use_arrow:
+            return self._get_data_arrow(query, params=params, remove_column=remove_column, remove_na=remove_na,
+                                        show_logs=show_logs, as_pyarrow=as_pyarrow, arraysize=arraysize)
+        if typed:
+            return self._get_data_typed(query, params=params, remove_column=remove_column, remove_na=remove_na,
+                                        show_logs=show_logs, arraysize=arraysize,
+                                        category_threshold=category_threshold, memory_report=memory_report)
         try:
+            from sqlalchemy import text
             query = text(query)
             engine = self.get_engine()
 
             with engine.connect() as conn:
-                data = pd.read_sql(query, con=conn)
+                with fetch_timer():
+                    data = pd.read_sql(query, con=conn, params=params)
                 data.columns = data.columns.str.lower()
                 if remove_column:
                     data.drop(columns=remove_column, inplace=True)
@@ -77,8 +385,274 @@ class OracleDataRetriever():
             print(f"Error during data retrieval: {e}")
             raise
 
-    @measure_time
-    def export_to_file(self, query, path, is_csv=True, sep=',', encoding='utf-8'):
+    @staticmethod
+    def _typed_output_handler(cursor, metadata):
+        """
+        fetch integral NUMBER(p<=18,0) as int and scaled NUMBER(p,s) as float; unconstrained and
+        wider NUMBERs keep the driver default (exact int for integral values)
+        """
+        if metadata.type_code is oracledb.DB_TYPE_NUMBER and (metadata.precision or 0) > 0:
+            if metadata.scale == 0 and metadata.precision <= 18:
+                return cursor.var(int, arraysize=cursor.arraysize)
+            if (metadata.scale or 0) > 0:
+                return cursor.var(float, arraysize=cursor.arraysize)
+
+    @staticmethod
+    def _dtype_from_metadata(metadata):
+        'pandas dtype for a column, or None to decide from the values'
+        type_code = metadata.type_code
+        if type_code is oracledb.DB_TYPE_NUMBER:
+            if (metadata.precision or 0) > 0 and metadata.scale == 0 and metadata.precision <= 18:
+                return 'Int16' if metadata.precision <= 4 else 'Int32' if metadata.precision <= 9 else 'Int64'
+            if (metadata.precision or 0) > 0 and (metadata.scale or 0) > 0:
+                return 'float64'
+            # unconstrained or wider than int64: decided from the values, see _exact_number_column
+            return None
+        if type_code is oracledb.DB_TYPE_BINARY_FLOAT:
+            return 'float32'
+        if type_code in (oracledb.DB_TYPE_BINARY_DOUBLE, oracledb.DB_TYPE_BINARY_INTEGER):
+            return 'float64'
+        if type_code in (oracledb.DB_TYPE_DATE, oracledb.DB_TYPE_TIMESTAMP):
+            return 'datetime64[ns]'
+        if type_code in (oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_NVARCHAR,
+                         oracledb.DB_TYPE_CHAR, oracledb.DB_TYPE_NCHAR):
+            return 'string'
+        return None
+
+    @staticmethod
+    def _exact_number_column(values, dtype=None):
+        """
+        NUMBER column built straight from the fetched Python values, so integers never pass
+        through float64: the given nullable integer dtype for NUMBER(p<=18,0); otherwise Int64
+        when every value is an int within int64, exact Python ints beyond that, and whatever
+        pandas infers (float64 for fractional values) for the rest
+        """
+        if dtype is not None:
+            return pd.Series(pd.array(values, dtype=dtype))
+        present = [value for value in values if value is not None]
+        if all(isinstance(value, int) for value in present):
+            if all(-2 ** 63 <= value < 2 ** 63 for value in present):
+                return pd.Series(pd.array(values, dtype='Int64'))
+            return pd.Series(values, dtype=object)
+        return pd.Series(values, dtype=object).infer_objects()
+
+    def _get_data_typed(self, query, params, remove_column, remove_na, show_logs, arraysize,
+                        category_threshold, memory_report):
+        """
+        get_data variant that fetches through an oracledb cursor with an output type handler
+        and converts every column to the compact dtype implied by its Oracle type.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.arraysize = arraysize
+                    cursor.outputtypehandler = self._typed_output_handler
+                    # LOBs come back as str/bytes within the fetch, as in the read_sql path
+                    with fetch_timer() as timer:
+                        cursor.execute(query, params, fetch_lobs=False)
+                        rows = cursor.fetchall()
+                        timer.round_trips = 1 + len(rows) // arraysize
+                    description = cursor.description
+                    data = pd.DataFrame.from_records(rows, columns=[col.name.lower() for col in description])
+                    for index, metadata in enumerate(description):
+                        dtype = self._dtype_from_metadata(metadata)
+                        if metadata.type_code is oracledb.DB_TYPE_NUMBER and (dtype is None or dtype.startswith('Int')):
+                            # from_records turns int columns with NULLs into float64; rebuild them exactly
+                            data[metadata.name.lower()] = self._exact_number_column(
+                                [row[index] for row in rows], dtype)
+                    del rows
+
+            size_before = data.memory_usage(deep=True) if memory_report else None
+            for metadata in description:
+                column = metadata.name.lower()
+                dtype = self._dtype_from_metadata(metadata)
+                if dtype == 'datetime64[ns]':
+                    data[column] = pd.to_datetime(data[column])
+                elif dtype == 'string':
+                    values = data[column]
+                    if len(values) and values.nunique(dropna=True) <= category_threshold * len(values):
+                        data[column] = values.astype('category')
+                elif dtype is not None:
+                    data[column] = data[column].astype(dtype)
+
+            if memory_report:
+                size_after = data.memory_usage(deep=True)
+                report = pd.DataFrame({
+                    'dtype': data.dtypes.astype(str),
+                    'mb_before': size_before.drop('Index') / 1024 / 1024,
+                    'mb_after': size_after.drop('Index') / 1024 / 1024,
+                })
+                print(report.round(2))
+                print(f"Total: {size_before.sum() / 1024 / 1024:.2f} MB -> {size_after.sum() / 1024 / 1024:.2f} MB")
+
+            if remove_column:
+                data.drop(columns=remove_column, inplace=True)
+            if remove_na:
+                data.dropna(inplace=True)
+
+            if show_logs:
+                print(data.head(5))
+            return data
+
+        except Exception as e:
+            print(f"Error during data retrieval: {e}")
+            raise
+
+    def _get_data_cached(self, query, params, remove_column, remove_na, show_logs, use_arrow, as_pyarrow,
+                         arraysize, cache_ttl, typed, category_threshold, memory_report):
+        """
+        get_data through the result cache. The full lower-cased result is cached, so
+        remove_column and remove_na are applied after the lookup. Arrow, typed and read_sql
+        results differ in dtypes, so each fetch mode has its own entry.
+        """
+        if self.cache is None:
+            raise ValueError("use_cache=True requires a cache: call enable_cache() first.")
+        use_arrow = use_arrow or as_pyarrow
+        mode = 'arrow' if use_arrow else f'typed:{category_threshold}' if typed else 'read_sql'
+        key = self.cache.make_key(query, params=params, user=self.user, dsn=self.dsn, mode=mode)
+        try:
+            data = self.cache.get(key, as_pyarrow=as_pyarrow)
+        except Exception as e:
+            # an unreadable entry or index must not fail the call; query the database instead
+            print(f"Cache read failed, running the query: {e}")
+            data = None
+        if data is None:
+            data = self._get_data_impl(query, params=params, use_arrow=use_arrow,
+                                       as_pyarrow=as_pyarrow, arraysize=arraysize, typed=typed,
+                                       category_threshold=category_threshold,
+                                       memory_report=memory_report)
+            try:
+                self.cache.put(key, data, query=query, ttl=cache_ttl)
+            except Exception as e:
+                # e.g. NUMBER values wider than int64, which Parquet cannot store exactly, or a full disk
+                print(f"Result not cached: {e}")
+        elif show_logs:
+            print(f"Result served from cache ({key[:12]}).")
+
+        if as_pyarrow:
+            if remove_column:
+                data = data.drop_columns(remove_column)
+            if remove_na:
+                data = data.drop_null()
+        else:
+            if remove_column:
+                data.drop(columns=remove_column, inplace=True)
+            if remove_na:
+                data.dropna(inplace=True)
+
+        if show_logs:
+            print(data.slice(0, 5) if as_pyarrow else data.head(5))
+        return data
+
+    def _get_data_arrow(self, query, params, remove_column, remove_na, show_logs, as_pyarrow, arraysize):
+        """
+        Columnar variant of get_data: the driver builds Arrow arrays directly
+        (fetch_df_all), so no per-row Python tuples are created.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError(
+                "use_arrow=True requires pyarrow: pip install nurtelecom_gras_library[arrow]") from e
+
+        try:
+            with self.get_connection() as conn:
+                with fetch_timer():
+                    odf = conn.fetch_df_all(statement=query, parameters=params, arraysize=arraysize)
+                table = pa.table(odf)
+
+            table = table.rename_columns([name.lower() for name in table.column_names])
+            if remove_column:
+                table = table.drop_columns(remove_column)
+
+            if as_pyarrow:
+                data = table.drop_null() if remove_na else table
+            else:
+                # self_destruct frees each Arrow column once converted, keeping peak memory ~1x
+                data = table.to_pandas(split_blocks=True, self_destruct=True)
+                del table
+                if remove_na:
+                    data.dropna(inplace=True)
+
+            if show_logs:
+                print(data.slice(0, 5) if as_pyarrow else data.head(5))
+            return data
+
+        except Exception as e:
+            print(f"Error during data retrieval: {e}")
+            raise
+
+    @record_call
+    def iter_data(self, query: str, chunk_rows: int = 100000, arraysize: int = 10000,
+                  prefetchrows: int = None, remove_column=None, remove_na: bool = False,
+                  use_arrow: bool = False, params=None, fetch_lobs: bool = False):
+        """
+        Stream the result of a SQL query as pandas DataFrame chunks from a single cursor,
+        so the full result set never has to fit in memory.
+
+        Usage:
+        for chunk in database_connector.iter_data(query, chunk_rows=200000):
+            # aggregate or forward the chunk
+
+        Note: the session stays open until the generator is exhausted or closed.
+
+        :param query: SQL query for data retrieval
+        :param chunk_rows: Number of rows in each yielded DataFrame, defaults to 100000
+        :param arraysize: Rows fetched from the database per round trip, defaults to 10000
+        :param prefetchrows: Rows returned together with the execute round trip, defaults to the driver setting
+        :param remove_column: Columns to remove from every chunk, defaults to None
+        :param remove_na: Flag to indicate if NA values should be dropped, defaults to False
+        :param use_arrow: Flag to build chunks through the driver's Arrow interface (fetch_df_batches), defaults to False
+        :param params: Bind values for the placeholders in query, defaults to None
+        :param fetch_lobs: Flag to return CLOB/BLOB columns as LOB locators (one extra round trip per
+            value when read) instead of str/bytes fetched inline, defaults to False
+        :return: generator of pandas DataFrames
+        """
+        remove_column = remove_column or []
+        try:
+            with self.get_connection() as conn:
+                if use_arrow:
+                    import pyarrow as pa
+                    chunks = (pa.table(odf).to_pandas()
+                              for odf in timed_iter(
+                                  conn.fetch_df_batches(statement=query, parameters=params, size=chunk_rows)))
+                else:
+                    chunks = self._iter_cursor_chunks(conn, query, params, chunk_rows, arraysize, prefetchrows,
+                                                      fetch_lobs)
+
+                for chunk in chunks:
+                    chunk.columns = chunk.columns.str.lower()
+                    if remove_column:
+                        chunk.drop(columns=remove_column, inplace=True)
+                    if remove_na:
+                        chunk.dropna(inplace=True)
+                    add_call_metrics(rows=len(chunk), batches=1)
+                    yield chunk
+
+        except Exception as e:
+            print(f"Error during data retrieval: {e}")
+            raise
+
+    @staticmethod
+    def _iter_cursor_chunks(conn, query, params, chunk_rows, arraysize, prefetchrows, fetch_lobs=False):
+        with conn.cursor() as cursor:
+            cursor.arraysize = arraysize
+            if prefetchrows is not None:
+                # must be set before execute to take effect
+                cursor.prefetchrows = prefetchrows
+            with fetch_timer():
+                cursor.execute(query, params, fetch_lobs=fetch_lobs)
+            column_names = [col[0] for col in cursor.description]
+            while True:
+                with fetch_timer() as timer:
+                    rows = cursor.fetchmany(chunk_rows)
+                    timer.round_trips = max(1, math.ceil(len(rows) / arraysize))
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=column_names)
+
+    @record_call
+    def export_to_file(self, query, path, is_csv=True, sep=',', encoding='utf-8', params=None):
         """
         encoding='utf-8-sig' if Cyrillic 
         Export data from a database query to a file in CSV or JSON format.
@@ -87,14 +661,17 @@ class OracleDataRetriever():
         :param path: File path to export the data
         :param is_csv: Boolean flag to determine if the output should be CSV (default) or JSON
         :param sep: Separator for CSV file, defaults to ';'
+        :param params: Bind values for the :name placeholders in query, defaults to None
         """
         try:
+            from sqlalchemy import text
             query = text(query)
-            engine = create_engine(self.ENGINE_PATH_WIN_AUTH)
+            engine = self.get_engine()
 
             with engine.connect() as conn, open(path, 'w') as f:
-                for i, partial_df in enumerate(pd.read_sql(query, conn, chunksize=100000)):
-                    print(f'Writing chunk "{i}" to "{path}"')
+                for i, partial_df in enumerate(timed_iter(pd.read_sql(query, conn, params=params, chunksize=100000))):
+                    logger.debug('Writing chunk "%s" to "%s"', i, path)
+                    add_call_metrics(rows=len(partial_df), batches=1)
                     if is_csv:
                         partial_df.to_csv(
                             f, index=False, header=(i == 0), sep=sep, encoding=encoding)
@@ -104,14 +681,21 @@ class OracleDataRetriever():
                         else:
                             partial_df.to_json(
                                 f, orient='records', lines=True, header=False)
+            add_call_metrics(bytes=os.path.getsize(path))
 
         except Exception as e:
             print(f"Error during export: {e}")
             raise
 
-    @measure_time
+    @record_call
     def export_to_file_oracle(self, query: str, path: str, is_csv: bool = True,
-                              sep: str = ',', encoding: str = 'utf-8', chunk_size: int = 1000) -> None:
+                              sep: str = ',', encoding: str = 'utf-8', chunk_size: int = None,
+                              file_format: str = None, compression: str = 'snappy',
+                              pipelined: bool = False, queue_size: int = 8,
+                              json_backend: str = 'auto', resumable: bool = False,
+                              key_column: str = None, checkpoint_every: int = 10,
+                              max_retries: int = 3, retry_delay: float = 30, params=None,
+                              fetch_lobs: bool = False) -> None:
         """
         Export data from an Oracle database query to a file using oracledb and csv module, with progress tracking.
 
@@ -121,43 +705,390 @@ class OracleDataRetriever():
         :param sep: Separator for CSV file, defaults to ','
         :param encoding: Encoding format to be used for writing the file, defaults to 'utf-8'
         :param chunk_size: Number of rows to process at a time, default is 1000
+            (100000 for Parquet, where every chunk becomes one row group)
+        :param file_format: 'csv', 'json' or 'parquet'; overrides is_csv when given, defaults to None
+        :param compression: Parquet compression codec, e.g. 'snappy', 'zstd', 'gzip' or None, defaults to 'snappy'.
+            CSV/JSON output is compressed on the fly when path ends with '.gz' or '.zst'.
+        :param pipelined: Flag to overlap fetching, serialization and writing on background threads, defaults to False
+        :param queue_size: Number of batches buffered between pipeline stages, defaults to 8
+        :param json_backend: JSON-lines encoder, 'auto' (orjson if installed), 'orjson' or 'json', defaults to 'auto'
+        :param resumable: Flag to keep a checkpoint in "<path>.ckpt" and continue from it after a dropped
+            session or a killed job, defaults to False. Without key_column the query must have a
+            deterministic ORDER BY, since the restart skips the rows already written.
+        :param key_column: Unique, monotonically fetched column; the export is ordered by it and restarts
+            with "key_column > last written key" (keyset pagination), defaults to None
+        :param checkpoint_every: Number of chunks between checkpoints, defaults to 10
+        :param max_retries: Automatic restarts on transient errors (ORA-03113, ORA-03135, ...), defaults to 3
+        :param retry_delay: Seconds to wait before the first retry, doubled on every retry, defaults to 30
+        :param params: Bind values for the placeholders in query, defaults to None
+        :param fetch_lobs: Flag to fetch CLOB/BLOB columns as LOB locators instead of inline str/bytes,
+            defaults to False. Inline fetching avoids one round trip per LOB; for very large LOBs use stream_lobs.
         """
+        file_format = (file_format or ('csv' if is_csv else 'json')).lower()
+        if resumable:
+            if file_format == 'parquet' or pipelined or path.endswith(('.gz', '.zst')):
+                raise ValueError("resumable export supports only uncompressed, non-pipelined CSV/JSON output.")
+            return self._export_resumable(query, params, path, file_format == 'csv', sep, encoding, chunk_size or 1000,
+                                          key_column, checkpoint_every, max_retries, retry_delay, json_backend)
+        if file_format == 'parquet':
+            return self._export_to_parquet(query, params, path, chunk_size=chunk_size or 100000,
+                                           compression=compression)
+        if file_format not in ('csv', 'json'):
+            raise ValueError(f"Unknown file_format '{file_format}', expected 'csv', 'json' or 'parquet'.")
+        is_csv = file_format == 'csv'
+        chunk_size = chunk_size or 1000
+
         try:
-            with oracledb.connect(user=self.user, password=self.password, dsn=self.dsn) as connection:
+            with self.get_connection() as connection:
                 cursor = connection.cursor()
+                cursor.arraysize = chunk_size
 
-                cursor.execute(query)
+                with fetch_timer():
+                    cursor.execute(query, params, fetch_lobs=fetch_lobs)
+                column_names = [col[0] for col in cursor.description]
 
-                with open(path, 'w', newline='', encoding=encoding) as f:
-                    writer = None
+                with self._open_export_file(path, encoding=encoding) as f:
                     if is_csv:
-                        writer = csv.writer(f, delimiter=sep)
+                        csv.writer(f, delimiter=sep).writerow(column_names)
 
-                    if is_csv:
-                        column_names = [col[0] for col in cursor.description]
-                        writer.writerow(column_names)
+                    serialize = self._make_serializer(column_names, is_csv, sep, json_backend)
+                    if pipelined:
+                        row_count, chunk_count = self._export_pipelined(
+                            cursor, f, serialize, chunk_size, queue_size)
+                    else:
+                        row_count = 0
+                        chunk_count = 0
+
+                        while True:
+                            with fetch_timer():
+                                rows = cursor.fetchmany(chunk_size)
+                            if not rows:
+                                break
+
+                            chunk_count += 1
+                            row_count += len(rows)
+
+                            f.write(serialize(rows))
+
+                            logger.debug("Chunk %d written, %d rows in this chunk, %d total rows written.",
+                                         chunk_count, len(rows), row_count)
+
+            add_call_metrics(rows=row_count, batches=chunk_count, bytes=os.path.getsize(path))
+            print(
+                f"Export complete. {row_count} rows written in {chunk_count} chunks.")
 
+        except oracledb.DatabaseError as e:
+            error, = e.args
+            print(f"Database error during export: {error.message}")
+            raise
+
+    def _export_resumable(self, query, params, path, is_csv, sep, encoding, chunk_size,
+                          key_column, checkpoint_every, max_retries, retry_delay, json_backend):
+        """
+        Checkpointed export: the file is flushed and "<path>.ckpt" records rows written,
+        byte offset and the last key every checkpoint_every chunks. On (re)start the file
+        is truncated to the checkpoint and fetching continues after it; transient session
+        errors are retried up to max_retries times with exponential backoff.
+        """
+        checkpoint_path = f"{path}.ckpt"
+        if params is not None and not isinstance(params, dict):
+            raise ValueError("resumable export needs named (dict) params, the restart adds a :last_key bind.")
+        query_hash = hashlib.sha256(
+            json.dumps([query, params, key_column, is_csv, sep], sort_keys=True, default=str).encode()).hexdigest()
+        attempt = 0
+        while True:
+            try:
+                checkpoint = self._read_checkpoint(checkpoint_path, query_hash)
+                row_count = self._export_from_checkpoint(
+                    query, params, path, checkpoint_path, checkpoint, query_hash, is_csv, sep, encoding,
+                    chunk_size, key_column, checkpoint_every, json_backend)
+                break
+            except (oracledb.DatabaseError, oracledb.InterfaceError) as e:
+                if attempt >= max_retries or not _is_transient_error(e):
+                    print(f"Database error during export: {e}")
+                    raise
+                attempt += 1
+                delay = retry_delay * 2 ** (attempt - 1)
+                print(f"Transient error during export ({e}), retry {attempt}/{max_retries} in {delay:.0f}s")
+                time.sleep(delay)
+
+        os.remove(checkpoint_path)
+        add_call_metrics(rows=row_count, bytes=os.path.getsize(path))
+        print(f"Export complete. {row_count} rows written.")
+
+    def _export_from_checkpoint(self, query, params, path, checkpoint_path, checkpoint, query_hash, is_csv, sep,
+                                encoding, chunk_size, key_column, checkpoint_every, json_backend):
+        source = f"SELECT * FROM ({query}) s"
+        params = dict(params or {})
+        if key_column is not None:
+            if checkpoint is not None and checkpoint['last_key'] is not None:
+                source += f" WHERE s.{key_column} > :last_key"
+                params['last_key'] = self._decode_checkpoint_key(checkpoint['last_key'])
+            source += f" ORDER BY s.{key_column}"
+        elif checkpoint is not None and checkpoint['rows_written']:
+            source += f" OFFSET {checkpoint['rows_written']} ROWS"
+
+        with self.get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.arraysize = chunk_size
+            cursor.execute(source, params, fetch_lobs=False)
+            column_names = [col[0] for col in cursor.description]
+            key_index = ([name.upper() for name in column_names].index(key_column.upper())
+                         if key_column is not None else None)
+            serialize = self._make_serializer(column_names, is_csv, sep, json_backend)
+            # one incremental encoder per file, so signature encodings (utf-8-sig) write their BOM once
+            encoder = codecs.getincrementalencoder(encoding)()
+
+            with open(path, 'r+b' if checkpoint is not None else 'wb') as f:
+                if checkpoint is not None:
+                    f.truncate(checkpoint['byte_offset'])
+                    f.seek(checkpoint['byte_offset'])
+                    # the BOM, if any, is already in the file
+                    encoder.encode('')
+                    row_count = checkpoint['rows_written']
+                    last_key = checkpoint['last_key']
+                    print(f"Resuming export of {path} after {row_count} rows.")
+                else:
+                    if is_csv:
+                        header = io.StringIO()
+                        csv.writer(header, delimiter=sep).writerow(column_names)
+                        f.write(encoder.encode(header.getvalue()))
                     row_count = 0
-                    chunk_count = 0
+                    last_key = None
+                    self._write_checkpoint(checkpoint_path, f, query_hash, row_count, last_key)
 
-                    while True:
+                chunk_count = 0
+                while True:
+                    with fetch_timer():
                         rows = cursor.fetchmany(chunk_size)
-                        if not rows:
-                            break
+                    if not rows:
+                        break
+
+                    f.write(encoder.encode(serialize(rows)))
+                    add_call_metrics(batches=1)
+                    chunk_count += 1
+                    row_count += len(rows)
+                    if key_index is not None:
+                        last_key = self._encode_checkpoint_key(rows[-1][key_index])
+
+                    if chunk_count % checkpoint_every == 0:
+                        self._write_checkpoint(checkpoint_path, f, query_hash, row_count, last_key)
+                        logger.debug("Checkpoint: %d total rows written.", row_count)
+
+                self._write_checkpoint(checkpoint_path, f, query_hash, row_count, last_key)
+        return row_count
+
+    @staticmethod
+    def _write_checkpoint(checkpoint_path, f, query_hash, rows_written, last_key):
+        'flush the export file to disk, then atomically replace the checkpoint'
+        f.flush()
+        os.fsync(f.fileno())
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as ckpt:
+            json.dump({'query_hash': query_hash, 'rows_written': rows_written,
+                       'byte_offset': f.tell(), 'last_key': last_key}, ckpt)
+        os.replace(tmp_path, checkpoint_path)
+
+    @staticmethod
+    def _read_checkpoint(checkpoint_path, query_hash):
+        if not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path) as ckpt:
+            checkpoint = json.load(ckpt)
+        if checkpoint['query_hash'] != query_hash:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} belongs to a different export; delete it to start over.")
+        return checkpoint
+
+    @staticmethod
+    def _encode_checkpoint_key(value):
+        if isinstance(value, datetime.datetime):
+            return {'datetime': value.isoformat()}
+        if isinstance(value, decimal.Decimal):
+            return {'decimal': str(value)}
+        return value
+
+    @staticmethod
+    def _decode_checkpoint_key(value):
+        if isinstance(value, dict) and 'datetime' in value:
+            return datetime.datetime.fromisoformat(value['datetime'])
+        if isinstance(value, dict) and 'decimal' in value:
+            return decimal.Decimal(value['decimal'])
+        return value
+
+    @staticmethod
+    def _open_export_file(path, encoding='utf-8', binary=False):
+        """
+        Open an export file for writing, compressing on the fly when the path
+        ends with '.gz' (gzip) or '.zst' (zstandard, requires the zstandard package).
+        """
+        text_kwargs = {} if binary else {'encoding': encoding, 'newline': ''}
+        mode = 'wb' if binary else 'wt'
+        if path.endswith('.gz'):
+            return gzip.open(path, mode, compresslevel=6, **text_kwargs)
+        if path.endswith('.zst'):
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError(
+                    "zstd compression requires zstandard: pip install nurtelecom_gras_library[zstd]") from e
+            return zstandard.open(path, mode, **text_kwargs)
+        return open(path, mode, **text_kwargs)
+
+    @staticmethod
+    def _make_serializer(column_names, is_csv, sep, json_backend='auto'):
+        """
+        Build the function that serializes one fetched batch to CSV or JSON-lines text.
 
-                        chunk_count += 1
-                        row_count += len(rows)
+        JSON keys are bound once per export; values are encoded by orjson when it is
+        installed (json_backend='auto' or 'orjson') or by a reusable C-accelerated
+        stdlib encoder. Dates/timestamps become ISO strings, numbers stay numbers and
+        LOBs are read into their str/bytes content.
+        """
+        if is_csv:
+            def serialize(rows):
+                buffer = io.StringIO()
+                csv.writer(buffer, delimiter=sep).writerows(rows)
+                return buffer.getvalue()
+            return serialize
+
+        keys = tuple(column_names)
+        if json_backend in ('auto', 'orjson'):
+            try:
+                import orjson
+            except ImportError:
+                if json_backend == 'orjson':
+                    raise ImportError(
+                        "json_backend='orjson' requires orjson: pip install nurtelecom_gras_library[fast-json]")
+            else:
+                dumps = orjson.dumps
+                option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+                def serialize(rows):
+                    return b''.join(
+                        dumps(dict(zip(keys, row)), default=_json_default, option=option)
+                        for row in rows).decode('utf-8')
+                return serialize
+        elif json_backend != 'json':
+            raise ValueError(f"Unknown json_backend '{json_backend}', expected 'auto', 'orjson' or 'json'.")
+
+        encode = json.JSONEncoder(default=_json_default, ensure_ascii=False,
+                                  check_circular=False, separators=(',', ':')).encode
+
+        def serialize(rows):
+            return '\n'.join(encode(dict(zip(keys, row))) for row in rows) + '\n'
+        return serialize
+
+    def _export_pipelined(self, cursor, f, serialize, chunk_size, queue_size):
+        """
+        Overlap fetching, serialization and (compressed) writing: the calling thread
+        fetches batches, a serializer thread turns them into text and a writer thread
+        writes it out, connected by bounded queues so memory stays at ~queue_size batches.
+        """
+        rows_queue = queue.Queue(maxsize=queue_size)
+        text_queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        errors = []
+
+        def put(q, item):
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.2)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(q):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.2)
+                except queue.Empty:
+                    pass
+            return None
+
+        def serializer():
+            try:
+                while (rows := get(rows_queue)) is not None:
+                    put(text_queue, serialize(rows))
+                put(text_queue, None)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
 
-                        if is_csv:
-                            writer.writerows(rows)
-                        else:
-                            for row in rows:
-                                json_data = {
-                                    column_names[i]: value for i, value in enumerate(row)}
-                                f.write(json.dumps(json_data) + '\n')
+        def writer():
+            try:
+                while (chunk := get(text_queue)) is not None:
+                    f.write(chunk)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        threads = [threading.Thread(target=serializer, daemon=True),
+                   threading.Thread(target=writer, daemon=True)]
+        for thread in threads:
+            thread.start()
+
+        row_count = 0
+        chunk_count = 0
+        try:
+            while not stop.is_set():
+                with fetch_timer():
+                    rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if not put(rows_queue, rows):
+                    break
+
+                chunk_count += 1
+                row_count += len(rows)
+                logger.debug("Chunk %d queued, %d rows in this chunk, %d total rows fetched.",
+                             chunk_count, len(rows), row_count)
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            put(rows_queue, None)
+            for thread in threads:
+                thread.join()
 
-                        print(
-                            f"Chunk {chunk_count} written, {len(rows)} rows in this chunk, {row_count} total rows written.")
+        if errors:
+            raise errors[0]
+        return row_count, chunk_count
+
+    def _export_to_parquet(self, query, params, path, chunk_size, compression):
+        """
+        Write a query result to a Parquet file, one row group per fetched batch.
+        Batches are fetched as typed Arrow columns (fetch_df_batches), so memory
+        is bounded by chunk_size rather than the table size.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow: pip install nurtelecom_gras_library[arrow]") from e
+
+        row_count = 0
+        chunk_count = 0
+        writer = None
+        try:
+            with self.get_connection() as connection:
+                for odf in timed_iter(connection.fetch_df_batches(statement=query, parameters=params,
+                                                                  size=chunk_size)):
+                    table = pa.table(odf)
+                    # the driver yields an empty first batch for an empty result,
+                    # so the file always gets the query's typed schema
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema, compression=compression)
+                    if table.num_rows == 0:
+                        continue
+                    writer.write_table(table, row_group_size=chunk_size)
+
+                    chunk_count += 1
+                    row_count += table.num_rows
+                    logger.debug("Chunk %d written, %d rows in this chunk, %d total rows written.",
+                                 chunk_count, table.num_rows, row_count)
 
             print(
                 f"Export complete. {row_count} rows written in {chunk_count} chunks.")
@@ -166,6 +1097,470 @@ class OracleDataRetriever():
             error, = e.args
             print(f"Database error during export: {error.message}")
             raise
+        finally:
+            if writer is not None:
+                writer.close()
+        add_call_metrics(rows=row_count, batches=chunk_count, bytes=os.path.getsize(path))
+
+    @record_call
+    def sync_to_parquet(self, dataset_dir: str, watermark_column: str, table_name: str = None,
+                        query: str = None, initial_watermark=None, partition_cols: list = None,
+                        chunk_size: int = 100000, compression: str = 'snappy', params=None) -> dict:
+        """
+        Incrementally copy a table or query into a local Parquet dataset.
+
+        Only rows with watermark_column greater than the stored watermark are fetched; they are
+        written as new Parquet files (hive-partitioned by partition_cols if given) and the new
+        watermark is then persisted atomically in "<dataset_dir>/_sync_state.json". Files of a run
+        that did not commit (crash, error) are removed on the next run, so a failed sync is simply
+        re-run; only files named gras-sync-<run_id>-* are ever removed, and a directory holding
+        other files but no state file is refused. The watermark must be monotonic: rows arriving later with a value at or below the
+        stored one are not picked up.
+
+        watermark_column='ORA_ROWSCN' (requires table_name) syncs rows changed since the last
+        run's SCN; the SCN is added as a "row_scn" column. Without ROWDEPENDENCIES on the table the
+        SCN is tracked per block, so unchanged rows sharing a block with changed ones are copied again.
+
+        Usage:
+        database_connector.sync_to_parquet('/data/cdr_daily', 'report_date', table_name='dwh.cdr_daily',
+                                           partition_cols=['report_date'])
+        cdr = pd.read_parquet('/data/cdr_daily')
+
+        :param dataset_dir: Local dataset directory, created if missing
+        :param watermark_column: Monotonic column (date, timestamp, id) or 'ORA_ROWSCN'
+        :param table_name: Source table, used when query is not given
+        :param query: Source query, defaults to all columns of table_name
+        :param initial_watermark: Lower bound for the first run, defaults to the full source
+        :param partition_cols: Columns to hive-partition the new files by, defaults to None
+        :param chunk_size: Rows fetched per Arrow batch, defaults to 100000
+        :param compression: Parquet codec, defaults to 'snappy'
+        :param params: Bind values for the placeholders in query, defaults to None
+        :return: dict with the new 'rows', the dataset-relative 'files' and the 'watermark'
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.dataset as ds
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet sync requires pyarrow: pip install nurtelecom_gras_library[arrow]") from e
+        if query is None and table_name is None:
+            raise ValueError("Either 'query' or 'table_name' must be provided.")
+        if params is not None and not isinstance(params, dict):
+            raise ValueError("sync needs named (dict) params, the watermark adds a :sync_watermark bind.")
+
+        if watermark_column.upper() == 'ORA_ROWSCN':
+            if table_name is None:
+                raise ValueError("watermark_column='ORA_ROWSCN' needs table_name.")
+            source = f"SELECT t.*, ORA_ROWSCN AS row_scn FROM {table_name} t"
+            watermark_column = 'row_scn'
+        else:
+            source = query or f"SELECT * FROM {table_name}"
+
+        os.makedirs(dataset_dir, exist_ok=True)
+        state_path = os.path.join(dataset_dir, '_sync_state.json')
+        source_hash = hashlib.sha256(
+            json.dumps([source, params, watermark_column.lower()], sort_keys=True, default=str).encode()).hexdigest()
+        state = self._read_sync_state(state_path, source_hash)
+        if not os.path.exists(state_path):
+            foreign = self._foreign_sync_files(dataset_dir)
+            if foreign:
+                raise ValueError(
+                    f"{dataset_dir} has no _sync_state.json but contains other files "
+                    f"({', '.join(sorted(foreign)[:5])}); sync into an empty or dedicated directory.")
+        self._remove_uncommitted_sync_files(dataset_dir, state)
+
+        statement = f"SELECT * FROM ({source}) s"
+        params = dict(params or {})
+        watermark = (self._decode_checkpoint_key(state['watermark']) if state['watermark'] is not None
+                     else initial_watermark)
+        if watermark is not None:
+            statement += f" WHERE s.{watermark_column} > :sync_watermark"
+            params['sync_watermark'] = watermark
+
+        # files are written to an underscore directory (ignored by dataset readers) and
+        # moved into place only when the whole result has been fetched
+        run_id = f"{datetime.datetime.now():%Y%m%dT%H%M%S}{uuid.uuid4().hex[:8]}"
+        staging_dir = os.path.join(dataset_dir, f"_staging-{run_id}")
+        os.makedirs(staging_dir)
+        row_count = 0
+        new_watermark = watermark
+        writer = None
+
+        def fetched_tables(connection):
+            nonlocal row_count, new_watermark
+            for batch_number, odf in enumerate(timed_iter(
+                    connection.fetch_df_batches(statement=statement, parameters=params, size=chunk_size))):
+                table = pa.table(odf)
+                if table.num_rows == 0:
+                    continue
+                table = table.rename_columns([name.lower() for name in table.column_names])
+                batch_max = pc.max(table[watermark_column.lower()]).as_py()
+                if new_watermark is None or batch_max > new_watermark:
+                    new_watermark = batch_max
+                row_count += table.num_rows
+                add_call_metrics(batches=1, bytes=table.nbytes)
+                logger.debug("Batch %d fetched, %d new rows so far.", batch_number, row_count)
+                yield table
+
+        try:
+            with self.get_connection() as connection:
+                tables = fetched_tables(connection)
+                if partition_cols:
+                    first = next(tables, None)
+                    if first is not None:
+                        # one dataset writer for the whole run keeps one file open per partition,
+                        # instead of a new file per partition for every fetched batch
+                        ds.write_dataset(
+                            (batch for table in itertools.chain([first], tables) for batch in table.to_batches()),
+                            staging_dir, schema=first.schema, format='parquet',
+                            partitioning=partition_cols, partitioning_flavor='hive',
+                            basename_template=f"gras-sync-{run_id}-00000-{{i}}.parquet",
+                            file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+                            max_rows_per_group=chunk_size, existing_data_behavior='overwrite_or_ignore')
+                else:
+                    for table in tables:
+                        if writer is None:
+                            writer = pq.ParquetWriter(os.path.join(staging_dir, f"gras-sync-{run_id}-00000.parquet"),
+                                                      table.schema, compression=compression)
+                        writer.write_table(table, row_group_size=chunk_size)
+            if writer is not None:
+                writer.close()
+                writer = None
+
+            files = []
+            for root, _, names in os.walk(staging_dir):
+                for name in names:
+                    relative_path = os.path.relpath(os.path.join(root, name), staging_dir)
+                    os.makedirs(os.path.dirname(os.path.join(dataset_dir, relative_path)), exist_ok=True)
+                    os.replace(os.path.join(root, name), os.path.join(dataset_dir, relative_path))
+                    files.append(relative_path)
+
+            if row_count:
+                state['watermark'] = self._encode_checkpoint_key(new_watermark)
+                state['runs'].append({'run_id': run_id, 'rows': row_count, 'files': files,
+                                      'watermark': state['watermark'],
+                                      'synced_at': datetime.datetime.now().isoformat()})
+                self._write_sync_state(state_path, state)
+            print(f"Sync complete. {row_count} new rows in {len(files)} files, watermark: {new_watermark}")
+            return {'rows': row_count, 'files': files, 'watermark': new_watermark}
+
+        except oracledb.DatabaseError as e:
+            print(f"Database error during sync: {e}")
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def _read_sync_state(state_path, source_hash):
+        if not os.path.exists(state_path):
+            return {'source_hash': source_hash, 'watermark': None, 'runs': []}
+        with open(state_path) as f:
+            state = json.load(f)
+        if state['source_hash'] != source_hash:
+            raise ValueError(
+                f"Sync state {state_path} belongs to a different source or watermark column; "
+                f"use another dataset_dir or delete it to start over.")
+        return state
+
+    @staticmethod
+    def _write_sync_state(state_path, state):
+        'fsync the new state, then atomically replace the old one'
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, state_path)
+
+    @staticmethod
+    def _foreign_sync_files(dataset_dir):
+        'dataset-relative paths of files sync_to_parquet did not write (hidden and underscore paths skipped)'
+        foreign = []
+        for root, dirs, names in os.walk(dataset_dir):
+            dirs[:] = [name for name in dirs if not name.startswith(('.', '_'))]
+            foreign += [os.path.relpath(os.path.join(root, name), dataset_dir) for name in names
+                        if not name.startswith(('.', '_')) and not SYNC_FILE_PATTERN.match(name)]
+        return foreign
+
+    @staticmethod
+    def _remove_uncommitted_sync_files(dataset_dir, state):
+        'delete staging directories and data files of sync runs that never reached the state file'
+        committed = {run['run_id'] for run in state['runs']}
+        for name in os.listdir(dataset_dir):
+            if name.startswith('_staging-'):
+                shutil.rmtree(os.path.join(dataset_dir, name), ignore_errors=True)
+        for root, _, names in os.walk(dataset_dir):
+            for name in names:
+                match = SYNC_FILE_PATTERN.match(name)
+                if match and match.group(1) not in committed:
+                    print(f"Removing {os.path.join(root, name)} of an unfinished sync.")
+                    os.remove(os.path.join(root, name))
+
+    @record_call
+    def stream_lobs(self, query: str, lob_columns: list, output_dir: str = None, sink=None,
+                    name_column: str = None, inline_max_size: int = 1024 * 1024,
+                    chunk_size: int = 1024 * 1024, params=None) -> pd.DataFrame:
+        """
+        Fetch a query with LOB columns, keeping small LOBs inline and writing large ones
+        chunk by chunk to files or sinks, so a LOB is never held in memory whole.
+
+        LOBs up to inline_max_size (characters for CLOB, bytes for BLOB) are returned as
+        str/bytes in the DataFrame; larger ones are streamed and the cell holds the file path
+        (output_dir) or the name attribute of the object returned by sink.
+
+        :param query: SQL query for data retrieval
+        :param lob_columns: Names of the CLOB/BLOB columns to handle
+        :param output_dir: Directory for streamed LOBs, written as "<name>_<column>.txt|.bin"
+        :param sink: Callable (name, column, is_text) returning a writable file-like object, closed after
+            the LOB is written; used instead of output_dir
+        :param name_column: Column used to name the streamed files, defaults to the row number
+        :param inline_max_size: Largest LOB kept inline, defaults to 1 MB
+        :param chunk_size: Amount read per round trip when streaming, defaults to 1 MB
+        :param params: Bind values for the placeholders in query, defaults to None
+        :return: pandas DataFrame containing the retrieved data
+        """
+        if output_dir is None and sink is None:
+            raise ValueError("Either 'output_dir' or 'sink' must be provided.")
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        lob_columns = [col.upper() for col in lob_columns]
+
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    column_names = [col[0] for col in cursor.description]
+                    lob_indexes = [column_names.index(col) for col in lob_columns]
+                    name_index = column_names.index(name_column.upper()) if name_column else None
+
+                    records = []
+                    streamed = 0
+                    for row_number, row in enumerate(cursor):
+                        row = list(row)
+                        name = row[name_index] if name_index is not None else row_number
+                        for index in lob_indexes:
+                            lob = row[index]
+                            if lob is None:
+                                continue
+                            if lob.size() <= inline_max_size:
+                                row[index] = lob.read()
+                                continue
+                            is_text = lob.type is not oracledb.DB_TYPE_BLOB
+                            if sink is not None:
+                                target = sink(name, column_names[index].lower(), is_text)
+                                row[index] = getattr(target, 'name', None)
+                            else:
+                                extension = 'txt' if is_text else 'bin'
+                                row[index] = os.path.join(
+                                    output_dir, f"{name}_{column_names[index].lower()}.{extension}")
+                                target = open(row[index], 'w' if is_text else 'wb',
+                                              **({'encoding': 'utf-8'} if is_text else {}))
+                            with target, fetch_timer() as timer:
+                                timer.round_trips = self._copy_lob(lob, target, chunk_size)
+                            streamed += 1
+                        records.append(row)
+
+            data = pd.DataFrame.from_records(records, columns=[name.lower() for name in column_names])
+            print(f"Fetched {len(data)} rows, {streamed} LOBs streamed.")
+            return data
+
+        except oracledb.DatabaseError as e:
+            print(f"Error during LOB retrieval: {e}")
+            raise
+
+    @staticmethod
+    def _copy_lob(lob, target, chunk_size):
+        'write a LOB to target in chunk_size pieces aligned to the LOB chunk size; returns the number of reads'
+        lob_chunk = lob.getchunksize()
+        amount = max(lob_chunk, chunk_size // lob_chunk * lob_chunk)
+        offset = 1
+        reads = 0
+        while True:
+            data = lob.read(offset, amount)
+            reads += 1
+            if not data:
+                return reads
+            target.write(data)
+            offset += len(data)
+
+    def make_slice_queries(self, query: str = None, table_name: str = None, num_slices: int = 4,
+                           method: str = 'hash', key: str = None, partitions: list = None) -> list:
+        """
+        Split a query or a table into disjoint slice queries for parallel extraction.
+
+        Methods:
+        - 'hash': ORA_HASH(key, num_slices - 1) buckets over a query or table (rows with NULL key go to bucket 0)
+        - 'rowid': num_slices contiguous ROWID ranges of table_name (DBMS_PARALLEL_EXECUTE-style chunking)
+        - 'partition': one slice per partition of table_name; partitions default to USER_TAB_PARTITIONS
+
+        :param query: SQL query to slice (hash method only), defaults to None
+        :param table_name: Table to slice, used when query is not given, defaults to None
+        :param num_slices: Number of slices for the hash and rowid methods, defaults to 4
+        :param method: Slicing method, one of 'hash', 'rowid', 'partition', defaults to 'hash'
+        :param key: Column hashed by the hash method, defaults to None
+        :param partitions: Explicit partition names for the partition method, defaults to None
+        :return: list of SQL queries, in slice order
+        """
+        method = method.lower()
+        if query is None and table_name is None:
+            raise ValueError("Either 'query' or 'table_name' must be provided.")
+        source = f"({query})" if query is not None else table_name
+
+        if method == 'hash':
+            if key is None:
+                raise ValueError("'key' is required for hash slicing.")
+            return [
+                f"SELECT * FROM {source} s WHERE ORA_HASH(s.{key}, {num_slices - 1}) = {i}"
+                + (f" OR s.{key} IS NULL" if i == 0 else '')
+                for i in range(num_slices)
+            ]
+
+        if table_name is None:
+            raise ValueError(f"'table_name' is required for {method} slicing.")
+
+        if method == 'rowid':
+            ranges = self._get_data_impl(f"""
+                SELECT ROWIDTOCHAR(MIN(rid)) AS lo, ROWIDTOCHAR(MAX(rid)) AS hi
+                  FROM (SELECT ROWID AS rid, NTILE({num_slices}) OVER (ORDER BY ROWID) AS bucket
+                          FROM {table_name})
+                 GROUP BY bucket
+                 ORDER BY bucket""")
+            return [
+                f"SELECT * FROM {table_name} WHERE ROWID BETWEEN CHARTOROWID('{lo}') AND CHARTOROWID('{hi}')"
+                for lo, hi in zip(ranges['lo'], ranges['hi'])
+            ]
+
+        if method == 'partition':
+            if partitions is None:
+                partitions = self._get_data_impl("""
+                    SELECT partition_name FROM user_tab_partitions
+                     WHERE table_name = UPPER(:table_name)
+                     ORDER BY partition_position""", params={'table_name': table_name})['partition_name'].tolist()
+            return [f"SELECT * FROM {table_name} PARTITION ({p})" for p in partitions]
+
+        raise ValueError(f"Unknown slicing method '{method}', expected 'hash', 'rowid' or 'partition'.")
+
+    @record_call
+    def get_data_parallel(self, query: str = None, table_name: str = None, num_slices: int = 4,
+                          method: str = 'hash', key: str = None, partitions: list = None,
+                          max_workers: int = None, remove_column=None, remove_na: bool = False,
+                          use_arrow: bool = False, params=None) -> pd.DataFrame:
+        """
+        Retrieve a large query or table over several sessions at once and concatenate
+        the slices in order. See make_slice_queries for the slicing methods.
+
+        Slices are fetched on a thread pool (the driver releases the GIL during network I/O).
+        With use_pool, keep pool_max >= max_workers so workers do not wait for sessions.
+
+        :param max_workers: Number of concurrent sessions, defaults to the number of slices
+        :param use_arrow: Flag to fetch every slice through the Arrow path, defaults to False
+        :param params: Bind values for the placeholders in query, shared by all slices, defaults to None
+        :return: pandas DataFrame containing the retrieved data
+        """
+        slice_queries = self.make_slice_queries(query=query, table_name=table_name, num_slices=num_slices,
+                                                method=method, key=key, partitions=partitions)
+        with ThreadPoolExecutor(max_workers=max_workers or len(slice_queries)) as executor:
+            # each slice runs in a copy of this context, so its metrics roll up into this call
+            futures = [executor.submit(contextvars.copy_context().run, self.get_data, slice_query, params=params,
+                                       remove_column=remove_column, remove_na=remove_na, use_arrow=use_arrow)
+                       for slice_query in slice_queries]
+            slices = [future.result() for future in futures]
+        return pd.concat(slices, ignore_index=True)
+
+    @record_call
+    def get_many(self, queries: dict, max_workers: int = 4, params: dict = None, raise_errors: bool = False,
+                 return_report: bool = False, **get_data_kwargs):
+        """
+        Run independent queries concurrently, so a report waits for its slowest query
+        instead of the sum of all of them.
+
+        Every query goes through get_data on its own session. With use_pool, keep
+        pool_max >= max_workers so workers do not wait for sessions. A failing query does
+        not stop the others; its result is None and its error is kept in the report.
+
+        Usage:
+        frames = database_connector.get_many({'sales': sales_query, 'churn': churn_query}, max_workers=8)
+
+        :param queries: Queries to run as {name: sql}
+        :param max_workers: Number of concurrent sessions, defaults to 4
+        :param params: Bind values per query as {name: params}, defaults to None
+        :param raise_errors: Flag to re-raise the first error once all queries have finished, defaults to False
+        :param return_report: Flag to also return {name: {'status', 'seconds', 'rows', 'error'}}, defaults to False
+        :param get_data_kwargs: Passed to every get_data call (use_arrow, typed, remove_na, ...; on an
+            OracleGeoDataImporter also geom_columns_list, use_geopandas=False for queries without geometry)
+        :return: {name: DataFrame} in the order of queries, or (results, report) with return_report
+        """
+        params = params or {}
+
+        def run(name, query):
+            start = timeit.default_timer()
+            try:
+                data = self.get_data(query, params=params.get(name), **get_data_kwargs)
+                return data, None, timeit.default_timer() - start
+            except Exception as e:
+                return None, e, timeit.default_timer() - start
+
+        results, report = {}, {}
+        if queries:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+                # each query runs in a copy of this context, so its metrics roll up into this call
+                futures = {name: executor.submit(contextvars.copy_context().run, run, name, query)
+                           for name, query in queries.items()}
+                for name, future in futures.items():
+                    data, error, seconds = future.result()
+                    results[name] = data
+                    report[name] = {'status': 'ok' if error is None else 'error', 'seconds': seconds,
+                                    'rows': 0 if data is None else len(data), 'error': error}
+
+        add_call_metrics(rows=sum(entry['rows'] for entry in report.values()))
+        errors = {name: entry['error'] for name, entry in report.items() if entry['error'] is not None}
+        if errors:
+            print(f"{len(errors)} of {len(queries)} queries failed: {', '.join(errors)}")
+            if raise_errors:
+                raise next(iter(errors.values()))
+        return (results, report) if return_report else results
+
+    @record_call
+    def export_to_file_oracle_parallel(self, path: str, query: str = None, table_name: str = None,
+                                       num_slices: int = 4, method: str = 'hash', key: str = None,
+                                       partitions: list = None, max_workers: int = None,
+                                       is_csv: bool = True, sep: str = ',', encoding: str = 'utf-8',
+                                       chunk_size: int = 1000, params=None) -> None:
+        """
+        Parallel variant of export_to_file_oracle: every slice is exported by its own session
+        to "<path>.part<N>", then the parts are appended to path in slice order
+        (CSV header kept only from the first part) and removed.
+        See make_slice_queries for the slicing methods.
+        """
+        slice_queries = self.make_slice_queries(query=query, table_name=table_name, num_slices=num_slices,
+                                                method=method, key=key, partitions=partitions)
+        part_paths = [f"{path}.part{i}" for i in range(len(slice_queries))]
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers or len(slice_queries)) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, self.export_to_file_oracle,
+                                           slice_query, part_path, is_csv=is_csv, sep=sep, encoding=encoding,
+                                           chunk_size=chunk_size, params=params)
+                           for slice_query, part_path in zip(slice_queries, part_paths)]
+                for future in futures:
+                    future.result()
+
+            with self._open_export_file(path, binary=True) as f:
+                for i, part_path in enumerate(part_paths):
+                    with open(part_path, 'rb') as part:
+                        if is_csv and i > 0:
+                            part.readline()
+                        shutil.copyfileobj(part, f)
+            add_call_metrics(bytes=os.path.getsize(path))
+            print(f"Parallel export complete. {len(part_paths)} slices merged into {path}.")
+
+        finally:
+            for part_path in part_paths:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
 
     def truncate_table(self, table_name):
         """
@@ -206,16 +1601,26 @@ class OracleDataRetriever():
             '''
         return query
 
-    def execute(self, query, verbose=False):
+    @record_call
+    def execute(self, query, verbose=False, params=None):
+        """
+        Execute a SQL statement or PL/SQL block.
+
+        :param query: SQL statement to execute
+        :param verbose: Flag to print progress messages, defaults to False
+        :param params: Bind values for the :name placeholders in query, defaults to None
+        """
+        engine = None
         try:
             # Use text function for query safety
+            from sqlalchemy import text
             query = text(query)
 
             # Create engine and execute query within context manager
             # engine = create_engine(self.ENGINE_PATH_WIN_AUTH)
             engine = self.get_engine()
-            with engine.connect() as conn:
-                conn.execute(query)
+            with engine.connect() as conn, fetch_timer():
+                conn.execute(query, params)
                 if verbose:
                     print('Query executed successfully.')
 
@@ -225,20 +1630,31 @@ class OracleDataRetriever():
             raise  # Reraising the exception to be handled at a higher level if needed
 
         finally:
-            # Dispose of the engine to close the connection properly
-            engine.dispose()
-            if verbose:
-                print('Connection closed and engine disposed.')
+            # Dispose of the engine to close the connection properly;
+            # in pooled mode the sessions are kept for the next call
+            if engine is not None and not self.use_pool:
+                engine.dispose()
+                if verbose:
+                    print('Connection closed and engine disposed.')
 
+    @record_call
     def upload_pandas_df_to_oracle(self, pandas_df: pd.DataFrame, table_name: str,
-                                   geometry_cols: list = [], srid: int = 4326) -> None:
+                                   geometry_cols: list = [], srid: int = 4326,
+                                   batch_size: int = 15000, direct_path: bool = False) -> int:
         """
         Uploads a pandas DataFrame to an Oracle table using bulk insert.
 
+        Batches are built lazily from the DataFrame's columns, so only one batch of
+        Python rows exists at a time, and the input DataFrame is not modified.
+
         :param pandas_df: DataFrame to upload
         :param table_name: Target Oracle table name
         :param geometry_cols: List of geometry columns to handle with SDO_GEOMETRY
         :param srid: Spatial Reference ID for geometry columns
+        :param batch_size: Number of rows sent per executemany call, defaults to 15000
+        :param direct_path: Flag to insert with the APPEND_VALUES hint (direct-path, above the
+            high-water mark, no redo on NOLOGGING tables); commits after every batch, defaults to False
+        :return: number of inserted rows
         """
         values_string_list = [
             f"SDO_GEOMETRY(:{i}, {srid})" if col in geometry_cols else f":{i}"
@@ -246,42 +1662,331 @@ class OracleDataRetriever():
         ]
         values_string = ', '.join(values_string_list)
 
-        if geometry_cols:
-            pandas_df[geometry_cols] = pandas_df[geometry_cols].astype(str)
-
         try:
-            pandas_tuples = [tuple(row) for row in pandas_df.itertuples(
-                index=False, name=None)]
-            sql_text = f"INSERT INTO {table_name} VALUES ({values_string})"
+            hint = '/*+ APPEND_VALUES */ ' if direct_path else ''
+            sql_text = f"INSERT {hint}INTO {table_name} VALUES ({values_string})"
 
-            with oracledb.connect(user=self.user, password=self.password, dsn=self.dsn) as oracle_conn:
+            with self.get_connection() as oracle_conn:
                 with oracle_conn.cursor() as oracle_cursor:
+                    # bind types come from the dtypes, so a leading None does not force a re-bind
+                    oracle_cursor.setinputsizes(*self._input_sizes_from_dtypes(pandas_df, geometry_cols))
                     row_count = 0
-                    batch_size = 15000
-                    for i in range(0, len(pandas_tuples), batch_size):
-                        batch = pandas_tuples[i:i + batch_size]
-                        oracle_cursor.executemany(sql_text, batch)
+                    for batch_number, batch in enumerate(
+                            self._iter_row_batches(pandas_df, batch_size, geometry_cols), start=1):
+                        with fetch_timer():
+                            oracle_cursor.executemany(sql_text, batch)
+                            if direct_path:
+                                # a direct-path insert must be committed before the table is touched again
+                                oracle_conn.commit()
                         row_count += oracle_cursor.rowcount
-                        print(
-                            f"Inserted batch {i // batch_size + 1}, total rows inserted: {row_count}")
+                        add_call_metrics(batches=1)
+                        logger.debug("Inserted batch %d, total rows inserted: %d", batch_number, row_count)
 
-                oracle_conn.commit()
+                with fetch_timer():
+                    oracle_conn.commit()
                 print(
                     f'Number of new added rows in "{table_name}": {row_count}')
+            add_call_metrics(bytes=int(pandas_df.memory_usage(index=False).sum()))
+            return row_count
 
         except oracledb.DatabaseError as e:
             print('Error during insertion:', e)
             raise
 
+    @record_call
+    def create_table_and_load(self, pandas_df: pd.DataFrame, table_name: str,
+                              column_types: dict = None, geometry_cols: list = [], srid: int = 4326,
+                              if_exists: str = 'fail', nologging: bool = False, compress: str = None,
+                              partition_column: str = None, partition_type: str = None,
+                              sample_size: int = 100000, varchar_headroom: float = 1.2,
+                              batch_size: int = 15000, direct_path: bool = None,
+                              **partition_options) -> dict:
+        """
+        Create a table shaped after a DataFrame and bulk load the DataFrame into it.
+
+        Column types come from infer_oracle_types (dtypes and sampled value lengths) and can be
+        overridden per column with column_types. Column names are kept whole (up to Oracle's
+        128 characters) instead of being truncated.
+
+        Usage:
+        database_connector.create_table_and_load(
+            kpi_df, 'kpi_daily', nologging=True, compress='BASIC',
+            partition_column='report_date', partition_type='RANGE', partition_granularity='MONTH',
+            partition_start='2024-01-01', partition_end='2026-01-01',
+            partition_interval="NUMTOYMINTERVAL(1, 'MONTH')")
+
+        :param pandas_df: DataFrame to create the table from and upload
+        :param table_name: Target Oracle table name
+        :param column_types: {column: Oracle type} overriding the inferred types, defaults to None
+        :param geometry_cols: List of geometry columns to handle with SDO_GEOMETRY
+        :param srid: Spatial Reference ID for geometry columns
+        :param if_exists: 'fail', 'append' (load into the existing table, same column order)
+            or 'replace' (drop and recreate), defaults to 'fail'
+        :param nologging: Flag to create the table NOLOGGING, defaults to False
+        :param compress: Table compression ('BASIC', 'ADVANCED', 'QUERY HIGH', ...), defaults to None
+        :param partition_column: Column to partition by, defaults to None
+        :param partition_type: 'RANGE', 'LIST' or 'HASH', defaults to None
+        :param sample_size: Rows sampled per text column for sizing, defaults to 100000
+        :param varchar_headroom: Factor applied to the longest sampled text value, defaults to 1.2
+        :param batch_size: Number of rows sent per executemany call, defaults to 15000
+        :param direct_path: Flag to load with direct-path inserts, defaults to True when
+            nologging or compress is set (both only take effect for direct-path loads)
+        :param partition_options: partition_granularity, partition_start, partition_end,
+            partition_interval and partition_values of make_table_query_from_pandas
+        :return: dict with the 'column_types', the 'ddl' (None when appending) and the loaded 'rows'
+        """
+        if if_exists not in ('fail', 'append', 'replace'):
+            raise ValueError(f"Unknown if_exists '{if_exists}', expected 'fail', 'append' or 'replace'.")
+        long_names = [str(col) for col in pandas_df.columns if len(str(col)) > 128]
+        if long_names:
+            raise ValueError(f"Column names longer than 128 characters: {long_names}")
+
+        inferred_types = infer_oracle_types(pandas_df, geometry_cols, sample_size=sample_size,
+                                            varchar_headroom=varchar_headroom)
+        inferred_types.update(column_types or {})
+        ddl = make_table_query_from_pandas(
+            pandas_df, table_name, column_types=inferred_types, nologging=nologging,
+            compress=compress, partition_column=partition_column, partition_type=partition_type,
+            max_column_name_len=128, **partition_options)
+
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    if if_exists == 'replace':
+                        cursor.execute(f"""
+                            BEGIN
+                                EXECUTE IMMEDIATE 'DROP TABLE {table_name} PURGE';
+                            EXCEPTION WHEN OTHERS THEN
+                                IF SQLCODE != -942 THEN RAISE; END IF;
+                            END;""")
+                    try:
+                        cursor.execute(ddl)
+                        print(f'Table "{table_name}" created.')
+                    except oracledb.DatabaseError as e:
+                        error, = e.args
+                        # ORA-00955: name is already used by an existing object
+                        if if_exists != 'append' or error.code != 955:
+                            raise
+                        ddl = None
+                        print(f'Table "{table_name}" exists, appending.')
+
+        except oracledb.DatabaseError as e:
+            print(f'Error while creating table "{table_name}": {e}')
+            raise
+
+        if direct_path is None:
+            direct_path = nologging or compress is not None
+        rows = self.upload_pandas_df_to_oracle(pandas_df, table_name, geometry_cols=geometry_cols,
+                                               srid=srid, batch_size=batch_size, direct_path=direct_path)
+        return {'column_types': inferred_types, 'ddl': ddl, 'rows': rows}
+
+    @record_call
+    def upload_pandas_df_to_oracle_parallel(self, pandas_df: pd.DataFrame, table_name: str,
+                                            num_workers: int = 4, partition_column: str = None,
+                                            geometry_cols: list = [], srid: int = 4326,
+                                            batch_size: int = 15000, batch_errors: bool = False) -> dict:
+        """
+        Bulk insert a DataFrame through num_workers concurrent sessions, each committing its own share.
+
+        Rows are split by the table's partition key (partition_column, or the key found in
+        USER_PART_KEY_COLUMNS), so that each worker writes to its own partitions; tables
+        without a partition key are split round-robin. With use_pool, keep pool_max >= num_workers.
+
+        :param pandas_df: DataFrame to upload
+        :param table_name: Target Oracle table name
+        :param num_workers: Number of concurrent sessions, defaults to 4
+        :param partition_column: DataFrame column to split by, defaults to the table's partition key
+        :param geometry_cols: List of geometry columns to handle with SDO_GEOMETRY
+        :param srid: Spatial Reference ID for geometry columns
+        :param batch_size: Number of rows per executemany call, defaults to 15000
+        :param batch_errors: Flag to reject bad rows (executemany batcherrors) instead of failing the worker
+        :return: dict with total 'rows', per-worker 'workers' results and collected 'errors'
+        """
+        if partition_column is None:
+            part_keys = [str(name).lower() for name in self._get_data_impl("""
+                SELECT column_name FROM user_part_key_columns
+                 WHERE name = UPPER(:table_name) AND object_type = 'TABLE'
+                 ORDER BY column_position""", params={'table_name': table_name})['column_name']]
+            frame_columns = {str(col).lower(): col for col in pandas_df.columns}
+            if len(part_keys) == 1 and part_keys[0] in frame_columns:
+                partition_column = frame_columns[part_keys[0]]
+
+        if partition_column is not None:
+            # greedy bin-packing of partition key groups, largest first
+            group_sizes = pandas_df.groupby(partition_column, dropna=False, sort=False).size()
+            worker_of_group = {}
+            worker_loads = [0] * num_workers
+            for value, size in group_sizes.sort_values(ascending=False).items():
+                worker = worker_loads.index(min(worker_loads))
+                worker_of_group[value] = worker
+                worker_loads[worker] += size
+            assignment = pandas_df[partition_column].map(worker_of_group).fillna(0).to_numpy()
+            shares = [pandas_df[assignment == worker] for worker in range(num_workers)]
+        else:
+            shares = [pandas_df.iloc[worker::num_workers] for worker in range(num_workers)]
+
+        columns = pandas_df.columns
+        values_string = ', '.join(
+            f"SDO_GEOMETRY(:{i}, {srid})" if col in geometry_cols else f":{i}"
+            for i, col in enumerate(columns, start=1))
+        sql_text = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({values_string})"
+        input_sizes = self._input_sizes_from_dtypes(pandas_df, geometry_cols)
+
+        def load_share(worker, share):
+            result = {'worker': worker, 'rows': 0, 'rejected': 0, 'error': None}
+            inserted = rejected = 0
+            try:
+                with self.get_connection() as oracle_conn:
+                    with oracle_conn.cursor() as oracle_cursor:
+                        oracle_cursor.setinputsizes(*input_sizes)
+                        for batch in self._iter_row_batches(share, batch_size, geometry_cols):
+                            with fetch_timer():
+                                oracle_cursor.executemany(sql_text, batch, batcherrors=batch_errors)
+                            add_call_metrics(batches=1)
+                            batch_rejected = len(oracle_cursor.getbatcherrors()) if batch_errors else 0
+                            inserted += len(batch) - batch_rejected
+                            rejected += batch_rejected
+                    oracle_conn.commit()
+                # a failed worker rolls back, so only committed work is counted
+                result['rows'], result['rejected'] = inserted, rejected
+                print(f"Worker {worker} inserted {result['rows']} rows into \"{table_name}\"")
+            except oracledb.DatabaseError as e:
+                print(f'Error in worker {worker} during insertion:', e)
+                result['error'] = e
+            return result
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            # workers run in copies of this context, so their driver time counts towards this call
+            futures = [executor.submit(contextvars.copy_context().run, load_share, worker, share)
+                       for worker, share in enumerate(shares)]
+            results = [future.result() for future in futures]
+
+        summary = {
+            'rows': sum(result['rows'] for result in results),
+            'rejected': sum(result['rejected'] for result in results),
+            'workers': results,
+            'errors': [result['error'] for result in results if result['error'] is not None],
+        }
+        print(
+            f'Number of new added rows in "{table_name}": {summary["rows"]} '
+            f'from {num_workers} sessions, failed workers: {len(summary["errors"])}')
+        return summary
+
+    @record_call
+    def load_file_to_oracle(self, path: str, table_name: str, file_format: str = None,
+                            column_mapping: dict = None, dtypes: dict = None, date_columns: list = None,
+                            date_format: str = None, batch_size: int = 50000, commit_every: int = 10,
+                            sep: str = ',', encoding: str = 'utf-8', geometry_cols: list = [],
+                            srid: int = 4326) -> int:
+        """
+        Stream a CSV or Parquet file into an Oracle table in bounded chunks, so memory
+        stays flat regardless of the file size.
+
+        :param path: Path to the CSV or Parquet file
+        :param table_name: Target Oracle table name
+        :param file_format: 'csv' or 'parquet', defaults to the file extension
+        :param column_mapping: {file column: table column}; when given only these columns are loaded,
+            otherwise all file columns are inserted into same-named table columns
+        :param dtypes: {file column: dtype} coercions applied to every chunk (e.g. {'msisdn': 'str', 'kpi': 'float'})
+        :param date_columns: File columns parsed to datetime, defaults to None
+        :param date_format: strftime format for date_columns, defaults to inference
+        :param batch_size: Rows read and sent per executemany call, defaults to 50000
+        :param commit_every: Number of batches between commits, defaults to 10
+        :param sep: CSV separator, defaults to ','
+        :param encoding: CSV encoding, defaults to 'utf-8'
+        :param geometry_cols: File columns holding WKT geometries (SDO_GEOMETRY), defaults to []
+        :param srid: Spatial Reference ID for geometry columns
+        :return: number of inserted rows
+        """
+        file_format = (file_format or os.path.splitext(path)[1].lstrip('.')).lower()
+        file_columns = list(column_mapping) if column_mapping else None
+        chunks = self._iter_file_chunks(path, file_format, batch_size, file_columns, sep, encoding)
+
+        row_count = 0
+        try:
+            with self.get_connection() as oracle_conn:
+                with oracle_conn.cursor() as oracle_cursor:
+                    sql_text = None
+                    for batch_number, chunk in enumerate(chunks, start=1):
+                        if dtypes:
+                            chunk = chunk.astype(dtypes)
+                        for col in date_columns or []:
+                            chunk[col] = pd.to_datetime(chunk[col], format=date_format)
+
+                        if sql_text is None:
+                            columns = list(chunk.columns)
+                            table_columns = [column_mapping.get(col, col) if column_mapping else col
+                                             for col in columns]
+                            values_string = ', '.join(
+                                f"SDO_GEOMETRY(:{i}, {srid})" if col in geometry_cols else f":{i}"
+                                for i, col in enumerate(columns, start=1))
+                            sql_text = (f"INSERT INTO {table_name} ({', '.join(table_columns)}) "
+                                        f"VALUES ({values_string})")
+                            input_sizes = self._input_sizes_from_dtypes(chunk, geometry_cols)
+                            if file_format == 'csv':
+                                # CSV dtypes are inferred per chunk; only trust the ones fixed by the caller
+                                fixed = set(dtypes or {}) | set(date_columns or [])
+                                input_sizes = [size if col in fixed else None
+                                               for col, size in zip(columns, input_sizes)]
+                            oracle_cursor.setinputsizes(*input_sizes)
+
+                        for batch in self._iter_row_batches(chunk[columns], batch_size, geometry_cols):
+                            with fetch_timer():
+                                oracle_cursor.executemany(sql_text, batch)
+                            row_count += oracle_cursor.rowcount
+                            add_call_metrics(batches=1)
+
+                        if batch_number % commit_every == 0:
+                            oracle_conn.commit()
+                            logger.debug("Committed batch %d, total rows inserted: %d", batch_number, row_count)
+
+                oracle_conn.commit()
+                print(f'Number of new added rows in "{table_name}": {row_count}')
+            return row_count
+
+        except oracledb.DatabaseError as e:
+            print(f'Error during file load after {row_count} inserted rows:', e)
+            raise
+
+    @staticmethod
+    def _iter_file_chunks(path, file_format, batch_size, columns, sep, encoding):
+        'yield DataFrames of at most batch_size rows from a CSV or Parquet file'
+        if file_format == 'csv':
+            yield from pd.read_csv(path, sep=sep, encoding=encoding, usecols=columns, chunksize=batch_size)
+        elif file_format == 'parquet':
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError(
+                    "Parquet input requires pyarrow: pip install nurtelecom_gras_library[arrow]") from e
+            for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+                yield record_batch.to_pandas()
+        else:
+            raise ValueError(f"Unknown file_format '{file_format}', expected 'csv' or 'parquet'.")
+
+    # shared with AsyncOracleDataRetriever, which must not import this class
+    _iter_row_batches = staticmethod(_iter_row_batches)
+    _input_sizes_from_dtypes = staticmethod(_input_sizes_from_dtypes)
+
+    @record_call
     def upload_pandas_df_to_oracle_row(self, pandas_df: pd.DataFrame, table_name: str,
-                                       geometry_cols: list = [], srid: int = 4326) -> None:
+                                       geometry_cols: list = [], srid: int = 4326,
+                                       batch_errors: bool = False, batch_size: int = 15000,
+                                       reject_file: str = None):
         """
         Uploads a pandas DataFrame to an Oracle table row by row, handling CLOBs for geometry columns.
 
+        With batch_errors=True rows are inserted in bulk with executemany(batcherrors=True):
+        bad rows are rejected by Oracle without failing the batch, and each batch is committed once.
+
         :param pandas_df: DataFrame to upload
         :param table_name: Target Oracle table name
         :param geometry_cols: List of geometry columns to handle with SDO_GEOMETRY
         :param srid: Spatial Reference ID for geometry columns
+        :param batch_errors: Flag to use the tolerant bulk mode instead of one execute/commit per row, defaults to False
+        :param batch_size: Number of rows per executemany call in bulk mode, defaults to 15000
+        :param reject_file: CSV path to write the rejected rows to in bulk mode, defaults to None
+        :return: in bulk mode, DataFrame of rejected rows with ora_error_code and ora_error_message columns
         """
         columns = pandas_df.columns
         values_string = ', '.join([
@@ -290,12 +1995,16 @@ class OracleDataRetriever():
         ])
         sql_text = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({values_string})"
 
+        if batch_errors:
+            return self._insert_with_batch_errors(pandas_df, table_name, sql_text, geometry_cols,
+                                                  batch_size, reject_file)
+
         for geo_col in geometry_cols:
             pandas_df[geo_col] = pandas_df[geo_col].apply(
                 lambda geom: geom.wkt if geom else None)
 
         try:
-            with oracledb.connect(user=self.user, password=self.password, dsn=self.dsn) as oracle_conn:
+            with self.get_connection() as oracle_conn:
                 with oracle_conn.cursor() as oracle_cursor:
                     row_count = 0
 
@@ -308,10 +2017,11 @@ class OracleDataRetriever():
                                 bind_row.append(value)
 
                         try:
-                            oracle_cursor.execute(sql_text, bind_row)
+                            with fetch_timer(round_trips=2):
+                                oracle_cursor.execute(sql_text, bind_row)
+                                oracle_conn.commit()
                             row_count += 1
-                            oracle_conn.commit()
-                            print(f'Number of added rows so far: {row_count}')
+                            logger.debug('Number of added rows so far: %d', row_count)
                         except oracledb.DatabaseError as e:
                             error, = e.args
                             print(
@@ -320,14 +2030,57 @@ class OracleDataRetriever():
 
                 print(
                     f'Number of new added rows in "{table_name}": {row_count}')
+            add_call_metrics(rows=row_count)
 
         except Exception as e:
             print('Error during insertion:', e)
             raise
 
+    def _insert_with_batch_errors(self, pandas_df, table_name, sql_text, geometry_cols,
+                                  batch_size, reject_file):
+        'bulk insert that collects rows rejected by Oracle instead of failing the batch'
+        rejected_positions = []
+        error_codes = []
+        error_messages = []
+        try:
+            with self.get_connection() as oracle_conn:
+                with oracle_conn.cursor() as oracle_cursor:
+                    oracle_cursor.setinputsizes(*self._input_sizes_from_dtypes(pandas_df, geometry_cols))
+                    row_count = 0
+                    for batch_number, batch in enumerate(
+                            self._iter_row_batches(pandas_df, batch_size, geometry_cols)):
+                        with fetch_timer(round_trips=2):
+                            oracle_cursor.executemany(sql_text, batch, batcherrors=True)
+                            batch_errors = oracle_cursor.getbatcherrors()
+                            oracle_conn.commit()
+                        for error in batch_errors:
+                            rejected_positions.append(batch_number * batch_size + error.offset)
+                            error_codes.append(error.code)
+                            error_messages.append(error.message)
+                        row_count += len(batch) - len(batch_errors)
+                        add_call_metrics(rows=len(batch) - len(batch_errors), batches=1)
+                        logger.debug("Inserted batch %d, total rows inserted: %d, rejected so far: %d",
+                                     batch_number + 1, row_count, len(rejected_positions))
+
+                print(
+                    f'Number of new added rows in "{table_name}": {row_count}, rejected rows: {len(rejected_positions)}')
+
+        except oracledb.DatabaseError as e:
+            print('Error during insertion:', e)
+            raise
+
+        rejected = pandas_df.iloc[rejected_positions].copy()
+        rejected['ora_error_code'] = error_codes
+        rejected['ora_error_message'] = error_messages
+        if reject_file:
+            rejected.to_csv(reject_file, index=True)
+        return rejected
+
+    @record_call
     def upsert_from_pandas_df(self, pandas_df: pd.DataFrame, table_name: str,
                           list_of_keys: list, clob_columns: list = [], 
-                          sum_update_columns: list = []) -> None:
+                          sum_update_columns: list = [], staging: str = None,
+                          batch_size: int = 15000):
         """
         Performs a upsert (merge) from a pandas DataFrame to an Oracle table,
         with reliable handling for CLOB data types.
@@ -337,7 +2090,15 @@ class OracleDataRetriever():
         :param list_of_keys: List of columns to be used as keys for matching
         :param clob_columns: List of columns that are of the CLOB data type
         :param sum_update_columns: List of columns where updates should sum existing values with new ones
+        :param staging: None to run one single-row MERGE per record (default), or 'private'
+            (private temporary table, Oracle 18c+) / 'global' (global temporary table) to bulk-load
+            the frame into a staging table and run one set-based MERGE
+        :param batch_size: Number of rows sent per executemany call, defaults to 15000
+        :return: dict with 'inserted' and 'updated' counts in staging mode, None otherwise
         """
+        if staging is not None:
+            return self._upsert_via_staging(pandas_df, table_name, list_of_keys, clob_columns,
+                                            sum_update_columns, staging, batch_size)
         list_of_all_columns = pandas_df.columns.tolist()
         list_regular_columns = [
             col for col in list_of_all_columns if col not in list_of_keys]
@@ -370,7 +2131,7 @@ class OracleDataRetriever():
         data_list = pandas_df.to_dict(orient='records')
 
         try:
-            with oracledb.connect(user=self.user, password=self.password, dsn=self.dsn) as oracle_conn:
+            with self.get_connection() as oracle_conn:
                 with oracle_conn.cursor() as oracle_cursor:
                     
                     # --- START OF ADDED CODE ---
@@ -383,17 +2144,100 @@ class OracleDataRetriever():
                     # --- END OF ADDED CODE ---
 
                     row_count = 0
-                    batch_size = 15000  # Note: smaller batch sizes may be needed for very large CLOBs
+                    # Note: smaller batch sizes may be needed for very large CLOBs
                     for i in range(0, len(data_list), batch_size):
                         batch = data_list[i:i + batch_size]
-                        oracle_cursor.executemany(merge_sql, batch)
+                        with fetch_timer():
+                            oracle_cursor.executemany(merge_sql, batch)
                         row_count += oracle_cursor.rowcount
-                        print(
-                            f"Processed batch {i // batch_size + 1}, total rows processed: {row_count}")
+                        add_call_metrics(batches=1)
+                        logger.debug("Processed batch %d, total rows processed: %d", i // batch_size + 1, row_count)
 
                 oracle_conn.commit()
                 print(
                     f'Number of upserted rows in "{table_name}": {row_count}')
+            add_call_metrics(rows=row_count)
+
+        except oracledb.DatabaseError as e:
+            print('Error during upsert:', e)
+            raise
+
+    def _upsert_via_staging(self, pandas_df, table_name, list_of_keys, clob_columns,
+                            sum_update_columns, staging, batch_size):
+        """
+        Set-based upsert: bulk-insert the frame into a temporary staging table shaped like
+        the target, count the rows without a match, then run a single MERGE in the same session.
+        """
+        staging = staging.lower()
+        if staging == 'private':
+            staging_table = f"ORA$PTT_{uuid.uuid4().hex[:20].upper()}"
+            create_prefix = f"CREATE PRIVATE TEMPORARY TABLE {staging_table} ON COMMIT PRESERVE DEFINITION"
+        elif staging == 'global':
+            staging_table = f"STG_{uuid.uuid4().hex[:20].upper()}"
+            create_prefix = f"CREATE GLOBAL TEMPORARY TABLE {staging_table} ON COMMIT PRESERVE ROWS"
+        else:
+            raise ValueError(f"Unknown staging '{staging}', expected 'private' or 'global'.")
+
+        list_of_all_columns = pandas_df.columns.tolist()
+        list_regular_columns = [
+            col for col in list_of_all_columns if col not in list_of_keys]
+        key_condition = ' AND '.join([f"t.{key} = s.{key}" for key in list_of_keys])
+        matched_selection = ',\n'.join([
+            f"t.{col} = t.{col} + s.{col}" if col in sum_update_columns else f"t.{col} = s.{col}"
+            for col in list_regular_columns
+        ])
+
+        merge_sql = f"""
+        MERGE INTO {table_name} t
+        USING {staging_table} s
+        ON ({key_condition})
+        WHEN MATCHED THEN
+            UPDATE SET
+                {matched_selection}
+        WHEN NOT MATCHED THEN
+            INSERT ({', '.join(list_of_all_columns)})
+            VALUES ({', '.join([f"s.{col}" for col in list_of_all_columns])})
+        """
+        insert_sql = (f"INSERT INTO {staging_table} ({', '.join(list_of_all_columns)}) "
+                      f"VALUES ({', '.join(f':{i}' for i in range(1, len(list_of_all_columns) + 1))})")
+
+        input_sizes = [oracledb.DB_TYPE_CLOB if col in clob_columns else size for col, size in
+                       zip(list_of_all_columns, self._input_sizes_from_dtypes(pandas_df))]
+
+        try:
+            with self.get_connection() as oracle_conn:
+                with oracle_conn.cursor() as oracle_cursor:
+                    oracle_cursor.execute(
+                        f"{create_prefix} AS SELECT {', '.join(list_of_all_columns)} FROM {table_name} WHERE 1 = 0")
+                    try:
+                        oracle_cursor.setinputsizes(*input_sizes)
+                        staged_count = 0
+                        for batch in self._iter_row_batches(pandas_df, batch_size):
+                            with fetch_timer():
+                                oracle_cursor.executemany(insert_sql, batch)
+                            staged_count += oracle_cursor.rowcount
+                            add_call_metrics(batches=1)
+                        print(f'Staged {staged_count} rows in "{staging_table}"')
+
+                        oracle_cursor.execute(
+                            f"SELECT COUNT(*) FROM {staging_table} s "
+                            f"WHERE NOT EXISTS (SELECT 1 FROM {table_name} t WHERE {key_condition})")
+                        inserted_count, = oracle_cursor.fetchone()
+
+                        with fetch_timer():
+                            oracle_cursor.execute(merge_sql)
+                        merged_count = oracle_cursor.rowcount
+                        add_call_metrics(rows=merged_count)
+                        oracle_conn.commit()
+                    finally:
+                        if staging == 'global':
+                            oracle_cursor.execute(f"TRUNCATE TABLE {staging_table}")
+                        oracle_cursor.execute(f"DROP TABLE {staging_table}")
+
+            counts = {'inserted': inserted_count, 'updated': merged_count - inserted_count}
+            print(
+                f'Upserted rows in "{table_name}": {counts["inserted"]} inserted, {counts["updated"]} updated')
+            return counts
 
         except oracledb.DatabaseError as e:
             print('Error during upsert:', e)
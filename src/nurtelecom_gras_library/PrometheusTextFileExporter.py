@@ -0,0 +1,74 @@
+import os
+import time
+import threading
+from collections import defaultdict
+
+
+class PrometheusTextFileExporter:
+    """
+    MetricsRecorder callback that keeps per-method totals and rewrites a Prometheus
+    text-format file after every call, for node_exporter's textfile collector.
+
+    The file is replaced atomically, so the collector never reads a partial file.
+
+    Usage:
+    exporter = PrometheusTextFileExporter('/var/lib/node_exporter/textfile/gras.prom',
+                                          labels={'job': 'nightly_export'})
+    metrics = MetricsRecorder(callbacks=[exporter])
+    """
+
+    TOTALS = (
+        ('calls_total', None, 'Client calls.'),
+        ('call_seconds_total', 'wall_time', 'Wall time of client calls.'),
+        ('fetch_seconds_total', 'fetch_time', 'Time spent in driver calls.'),
+        ('process_seconds_total', 'process_time', 'Client-side processing time.'),
+        ('rows_total', 'rows', 'Rows fetched or written.'),
+        ('bytes_total', 'bytes', 'Bytes fetched or written.'),
+        ('round_trips_total', 'round_trips', 'Driver calls reaching the database.'),
+        ('batches_total', 'batches', 'Fetched or sent batches.'),
+    )
+
+    def __init__(self, path: str, namespace: str = 'gras', labels: dict = None) -> None:
+        self.path = path
+        self.namespace = namespace
+        self.labels = dict(labels or {})
+        self._totals = defaultdict(lambda: defaultdict(float))
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict) -> None:
+        key = (record['client'], record['method'], record['status'])
+        with self._lock:
+            totals = self._totals[key]
+            for name, field, _ in self.TOTALS:
+                totals[name] += 1 if field is None else record[field]
+            self._last[key] = (record['wall_time'], time.time())
+            self._write()
+
+    def _format_labels(self, key):
+        client, method, status = key
+        labels = {**self.labels, 'client': client, 'method': method, 'status': status}
+        return ','.join(f'{name}="{value}"' for name, value in labels.items())
+
+    def _write(self):
+        lines = []
+        for name, _, help_text in self.TOTALS:
+            metric = f"{self.namespace}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+            lines += [f"{metric}{{{self._format_labels(key)}}} {totals[name]}"
+                      for key, totals in self._totals.items()]
+        for name, index, help_text in (('last_call_seconds', 0, 'Wall time of the last call.'),
+                                       ('last_call_timestamp_seconds', 1, 'End time of the last call.')):
+            metric = f"{self.namespace}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            lines += [f"{metric}{{{self._format_labels(key)}}} {last[index]:.3f}"
+                      for key, last in self._last.items()]
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+
+
+if __name__ == "__main__":
+    pass
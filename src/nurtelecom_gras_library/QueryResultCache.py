@@ -0,0 +1,216 @@
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: entries stay consistent per process only
+    fcntl = None
+
+
+class QueryResultCache:
+    """
+    On-disk cache of query results stored as Parquet files.
+
+    Entries are keyed by the normalized SQL, the bind parameters, the
+    connection's user/service and the fetch mode, expire after a per-entry TTL and are evicted
+    least-recently-used first once the cache exceeds max_size_mb.
+    Requires pyarrow.
+
+    Usage:
+    cache = QueryResultCache('/tmp/gras_cache', max_size_mb=2048, default_ttl=3600)
+    database_connector.enable_cache(cache)
+    cells = database_connector.get_data(query, use_cache=True)
+    cache.invalidate('dim_cells')
+    """
+
+    TABLE_PATTERN = re.compile(r'\b(from|join)\s+([\w$#."]+)', re.IGNORECASE)
+    # ", name" after an optional alias: the rest of an old-style FROM a x, b y list
+    NEXT_TABLE_PATTERN = re.compile(r'\s*(?:(?:as\s+)?[\w$#"]+\s*)?,\s*([\w$#."]+)', re.IGNORECASE)
+    QUOTED_PATTERN = re.compile(r"('(?:[^']|'')*'|\"[^\"]*\")")
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 1024, default_ttl: float = 3600) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.default_ttl = default_ttl
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.lock_path = os.path.join(cache_dir, 'index.lock')
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def normalize_query(cls, query: str) -> str:
+        """
+        collapse whitespace outside quoted literals and drop a trailing semicolon so formatting
+        does not change the key; 'a  b' and 'a b' stay different queries
+        """
+        parts = cls.QUOTED_PATTERN.split(query)
+        for i in range(0, len(parts), 2):
+            parts[i] = re.sub(r'\s+', ' ', parts[i])
+        return ''.join(parts).strip().rstrip(';').strip()
+
+    def make_key(self, query: str, params=None, user: str = '', dsn: str = '', mode: str = '') -> str:
+        'mode separates results of the same query fetched differently (read_sql, arrow, typed)'
+        payload = json.dumps([self.normalize_query(query), params, user.upper(), dsn, mode],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def tables_in_query(self, query: str) -> list:
+        'table names after FROM (comma-separated lists too) and JOIN, schema-qualified and bare, upper-cased'
+        names = []
+        for match in self.TABLE_PATTERN.finditer(query):
+            names.append(match.group(2))
+            position = match.end()
+            while match.group(1).lower() == 'from':
+                next_table = self.NEXT_TABLE_PATTERN.match(query, position)
+                if next_table is None:
+                    break
+                names.append(next_table.group(1))
+                position = next_table.end()
+        tables = set()
+        for name in names:
+            name = name.replace('"', '').upper()
+            if not name:
+                continue
+            tables.add(name)
+            tables.add(name.split('.')[-1])
+        return sorted(tables)
+
+    def get(self, key: str, as_pyarrow: bool = False):
+        """
+        Return the cached result for key, or None if it is missing or expired.
+        """
+        import pyarrow.parquet as pq
+        with self._index_lock():
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            if time.time() > entry['expires_at'] or not os.path.exists(self._entry_path(key)):
+                self._remove_entry(index, key)
+                self._write_index(index)
+                return None
+            entry['last_access'] = time.time()
+            self._write_index(index)
+            table = pq.read_table(self._entry_path(key))
+        return table if as_pyarrow else table.to_pandas()
+
+    def put(self, key: str, data, query: str = '', ttl: float = None) -> None:
+        """
+        Store a pandas DataFrame or pyarrow.Table under key and evict entries over the size budget.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+        path = self._entry_path(key)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        now = time.time()
+        with self._index_lock():
+            index = self._read_index()
+            index[key] = {
+                'query': self.normalize_query(query),
+                'tables': self.tables_in_query(query),
+                'size': os.path.getsize(path),
+                'created_at': now,
+                'last_access': now,
+                'expires_at': now + (self.default_ttl if ttl is None else ttl),
+            }
+            self._evict(index)
+            self._write_index(index)
+
+    def invalidate(self, table_name: str = None) -> int:
+        """
+        Drop every entry whose query reads table_name (bare or schema-qualified),
+        or the whole cache when table_name is None. Returns the number of entries removed.
+        Queries that mention the name anywhere else in their text are dropped too: a needless
+        miss is cheaper than serving a stale result for a table the parser did not recognise.
+        """
+        with self._index_lock():
+            index = self._read_index()
+            if table_name is None:
+                keys = list(index)
+            else:
+                table_name = table_name.replace('"', '').upper()
+                mention = re.compile(r'(?<![\w$#])' + re.escape(table_name.split('.')[-1]) + r'(?![\w$#])',
+                                     re.IGNORECASE)
+                keys = [key for key, entry in index.items()
+                        if table_name in entry['tables'] or mention.search(entry['query'])]
+            for key in keys:
+                self._remove_entry(index, key)
+            self._write_index(index)
+        return len(keys)
+
+    def stats(self) -> dict:
+        with self._index_lock():
+            index = self._read_index()
+        return {
+            'entries': len(index),
+            'size_mb': sum(entry['size'] for entry in index.values()) / 1024 / 1024,
+            'max_size_mb': self.max_size_bytes / 1024 / 1024,
+        }
+
+    def _evict(self, index):
+        now = time.time()
+        for key in [key for key, entry in index.items() if now > entry['expires_at']]:
+            self._remove_entry(index, key)
+        total_size = sum(entry['size'] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]['last_access']):
+            if total_size <= self.max_size_bytes:
+                break
+            total_size -= index[key]['size']
+            self._remove_entry(index, key)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.parquet')
+
+    def _remove_entry(self, index, key):
+        index.pop(key, None)
+        if os.path.exists(self._entry_path(key)):
+            os.remove(self._entry_path(key))
+
+    @contextmanager
+    def _index_lock(self):
+        'serialise index read-modify-write across threads and, through a lock file, across processes'
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def _write_index(self, index):
+        fd, tmp_path = tempfile.mkstemp(prefix='index.', suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+if __name__ == "__main__":
+    pass
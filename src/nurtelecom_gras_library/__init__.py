@@ -1,10 +1,42 @@
+import importlib
 from importlib.metadata import version
 __version__ = version("nurtelecom_gras_library")
 
-from nurtelecom_gras_library.additional_functions import *
-from nurtelecom_gras_library.OracleDataRetriever import OracleDataRetriever
-from nurtelecom_gras_library.updated_connection import get_db_connection
-from nurtelecom_gras_library.JiraServiceDeskClient import JiraClient
-from nurtelecom_gras_library.TableauServerManager import TableauServerManager
+# Public names and the submodules defining them. They are imported on first access
+# (PEP 562), so a job that only sends a Telegram message does not load pandas,
+# SQLAlchemy, geopandas or tableauserverclient.
+_LAZY_ATTRIBUTES = {
+    'OracleDataRetriever': 'OracleDataRetriever',
+    'init_oracle_client': 'OracleDataRetriever',
+    'OracleGeoDataImporter': 'OracleGeoDataImporter',
+    'QueryResultCache': 'QueryResultCache',
+    'AsyncOracleDataRetriever': 'AsyncOracleDataRetriever',
+    'MetricsRecorder': 'MetricsRecorder',
+    'PrometheusTextFileExporter': 'PrometheusTextFileExporter',
+    'get_db_connection': 'updated_connection',
+    'default_registry': 'updated_connection',
+    'ConnectionRegistry': 'ConnectionRegistry',
+    'JiraClient': 'JiraServiceDeskClient',
+    'TableauServerManager': 'TableauServerManager',
+}
+_LAZY_ATTRIBUTES.update(dict.fromkeys([
+    'get_list_of_objects', 'merge_clob_maker', 'value_extractor', 'make_table_query_from_pandas_old',
+    'make_table_query_from_pandas', 'infer_oracle_types', 'send_telegram_msg', 'send_file_via_telegram',
+    'send_photo_via_telegram', 'send_msg_via_telegram', 'send_sms', 'get_a_copy', 'send_email',
+    'error_sender', 'measure_time', 'pass_encoder', 'pass_decoder', 'voronoi_split', 'get_all_cred_dict',
+], 'additional_functions'))
 
+__all__ = sorted(_LAZY_ATTRIBUTES)
 
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,45 @@
+'row batching and bind typing shared by the sync and async bulk loaders'
+import oracledb
+import pandas as pd
+
+
+def _iter_row_batches(pandas_df, batch_size, geometry_cols=()):
+    """
+    Yield lists of row tuples of at most batch_size rows, built column by column.
+    NaN/NaT become None (NULL) and geometry columns are converted to WKT strings.
+    """
+    for start in range(0, len(pandas_df), batch_size):
+        chunk = pandas_df.iloc[start:start + batch_size]
+        columns = []
+        for col in chunk.columns:
+            series = chunk[col]
+            if col in geometry_cols:
+                values = [None if geom is None or pd.isna(geom) else str(geom) for geom in series]
+            else:
+                values = series.to_numpy(dtype=object)
+                mask = pd.isna(values)
+                if mask.any():
+                    # to_numpy may return a view of an object column, so copy before writing
+                    values = values.copy()
+                    values[mask] = None
+            columns.append(values)
+        yield list(zip(*columns))
+
+
+def _input_sizes_from_dtypes(pandas_df, geometry_cols=()):
+    'oracledb bind types for setinputsizes, derived from the DataFrame dtypes (None lets the driver decide)'
+    input_sizes = []
+    for col, dtype in pandas_df.dtypes.items():
+        series = pandas_df[col]
+        if col in geometry_cols or pd.api.types.is_bool_dtype(dtype):
+            input_sizes.append(None)
+        elif pd.api.types.is_numeric_dtype(dtype):
+            input_sizes.append(oracledb.DB_TYPE_NUMBER)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            input_sizes.append(oracledb.DB_TYPE_TIMESTAMP)
+        elif pd.api.types.is_string_dtype(series):
+            max_length = series.str.len().max()
+            input_sizes.append(int(max_length) if max_length == max_length and max_length else None)
+        else:
+            input_sizes.append(None)
+    return input_sizes
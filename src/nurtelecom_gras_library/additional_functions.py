@@ -1,5 +1,8 @@
 from genericpath import isdir
 import os
+import math
+import numbers
+import datetime
 import shutil
 import smtplib
 import mimetypes
@@ -7,9 +10,7 @@ from argparse import ArgumentParser
 from email.message import EmailMessage
 from email.policy import SMTP
 import timeit
-import requests
 import base64
-import hvac
 
 
 
@@ -84,7 +85,11 @@ def make_table_query_from_pandas(
     # e.g., "DATE '2025-01-01'" or "TIMESTAMP '2025-01-01 00:00:00'"
     partition_end=None,
     partition_interval=None,        # e.g., "INTERVAL '1' MONTH"
-    partition_values=None           # for LIST/HASH
+    partition_values=None,          # for LIST/HASH
+    column_types=None,              # {column: Oracle type}, takes precedence over the lists
+    nologging=False,
+    compress=None,                  # 'BASIC', 'ADVANCED', 'QUERY HIGH', ... or a full clause
+    max_column_name_len=25
 ):
     """
     Generate a CREATE TABLE query from a pandas DataFrame with optional partitioning.
@@ -105,14 +110,24 @@ def make_table_query_from_pandas(
         partition_end (str, optional): End value for RANGE/INTERVAL partitioning.
         partition_interval (str, optional): Interval for INTERVAL partitioning, e.g., "INTERVAL '1' MONTH".
         partition_values (list, optional): Partition values (for LIST/HASH/RANGE).
+        column_types (dict, optional): Oracle type per column, e.g. from infer_oracle_types.
+        nologging (bool): Create the table NOLOGGING (only direct-path loads skip redo).
+        compress (str, optional): Table compression, e.g. 'BASIC', 'ADVANCED' or 'QUERY HIGH'.
+        max_column_name_len (int): Longer column names are truncated, with a warning.
 
     Returns:
         str: CREATE TABLE query.
     """
+    import pandas as pd
+    column_types = column_types or {}
     query_for_creating_table = f'CREATE TABLE {table_name} (\n'
-    for column in df:
-        column = f"{column}"[:25]
-        if column in list_num_columns:
+    for original_column in df:
+        column = f"{original_column}"[:max_column_name_len]
+        if column != f"{original_column}":
+            print(f'Warning: column name "{original_column}" truncated to "{column}"')
+        if original_column in column_types:
+            query_for_creating_table += f"""{column} \t {column_types[original_column]},\n"""
+        elif column in list_num_columns:
             query_for_creating_table += f"""{column} \t number,\n"""
         elif column in list_date_columns:
             query_for_creating_table += f"""{column} \t date,\n"""
@@ -127,12 +142,27 @@ def make_table_query_from_pandas(
     query_for_creating_table = query_for_creating_table[:-2]
     query_for_creating_table += '\n)'
 
+    # Segment attributes go before the partitioning clause
+    if nologging:
+        query_for_creating_table += '\nNOLOGGING'
+    if compress:
+        compress_clauses = {
+            'BASIC': 'ROW STORE COMPRESS BASIC',
+            'ADVANCED': 'ROW STORE COMPRESS ADVANCED',
+            'QUERY LOW': 'COLUMN STORE COMPRESS FOR QUERY LOW',
+            'QUERY HIGH': 'COLUMN STORE COMPRESS FOR QUERY HIGH',
+            'ARCHIVE LOW': 'COLUMN STORE COMPRESS FOR ARCHIVE LOW',
+            'ARCHIVE HIGH': 'COLUMN STORE COMPRESS FOR ARCHIVE HIGH',
+        }
+        query_for_creating_table += f"\n{compress_clauses.get(compress.upper(), compress)}"
+
     # Add partitioning clause if specified
     if partition_column and partition_type:
         partition_type = partition_type.upper()
         # Determine if partition column is date or timestamp for formatting
-        is_timestamp = partition_column in list_timestamp_columns
-        is_date = partition_column in list_date_columns
+        partition_column_type = str(column_types.get(partition_column, '')).upper()
+        is_timestamp = partition_column in list_timestamp_columns or partition_column_type.startswith('TIMESTAMP')
+        is_date = partition_column in list_date_columns or partition_column_type == 'DATE'
 
         def format_partition_value(val):
             if is_timestamp:
@@ -217,26 +247,94 @@ def make_table_query_from_pandas(
 
     return query_for_creating_table
 
+def infer_oracle_types(df, geometry_cols=[], sample_size=100000, varchar_headroom=1.2,
+                       varchar_len=500, max_varchar_len=4000):
+    """
+    Infer Oracle column types from a pandas DataFrame, for make_table_query_from_pandas.
+
+    Numeric, boolean and datetime columns are mapped from their dtype; float columns holding
+    only whole numbers (integers with NaN) stay NUMBER. Text and binary columns are sized
+    from the longest value (in UTF-8 bytes) in a sample of at most sample_size rows times
+    varchar_headroom, and become CLOB/BLOB past max_varchar_len.
+
+    Args:
+        df (pd.DataFrame): DataFrame to infer the types of.
+        geometry_cols (list): Columns to be SDO_GEOMETRY.
+        sample_size (int): Rows sampled per text column; None scans the whole column.
+        varchar_headroom (float): Factor applied to the longest sampled value.
+        varchar_len (int): Length for text columns without any non-null value.
+        max_varchar_len (int): Longest VARCHAR2 in bytes (32767 with MAX_STRING_SIZE=EXTENDED).
+
+    Returns:
+        dict: {column: Oracle type}.
+    """
+    import pandas as pd
+    column_types = {}
+    for column in df.columns:
+        series = df[column]
+        dtype = series.dtype
+        if column in geometry_cols:
+            column_types[column] = 'SDO_GEOMETRY'
+        elif pd.api.types.is_bool_dtype(dtype):
+            column_types[column] = 'NUMBER(1)'
+        elif pd.api.types.is_integer_dtype(dtype):
+            # digits of the largest value the dtype can hold
+            precision = len(str(2 ** (8 * dtype.itemsize - (dtype.kind == 'i')) - 1))
+            column_types[column] = f'NUMBER({precision})'
+        elif pd.api.types.is_float_dtype(dtype):
+            if (series.dropna() % 1 == 0).all():
+                # whole numbers stored as float, typically an int column with NaN
+                column_types[column] = 'NUMBER'
+            else:
+                column_types[column] = 'BINARY_FLOAT' if dtype.itemsize == 4 else 'BINARY_DOUBLE'
+        elif isinstance(dtype, pd.DatetimeTZDtype):
+            column_types[column] = 'TIMESTAMP WITH TIME ZONE'
+        elif pd.api.types.is_datetime64_dtype(dtype):
+            values = series.dropna()
+            has_fraction = (values != values.dt.floor('s')).any()
+            column_types[column] = 'TIMESTAMP' if has_fraction else 'DATE'
+        elif pd.api.types.is_timedelta64_dtype(dtype):
+            column_types[column] = 'INTERVAL DAY(9) TO SECOND(6)'
+        else:
+            values = series.dropna()
+            if sample_size is not None and len(values) > sample_size:
+                values = values.sample(sample_size, random_state=0)
+            column_types[column] = _oracle_type_for_objects(
+                list(values), varchar_headroom, varchar_len, max_varchar_len)
+    return column_types
+
+def _oracle_type_for_objects(values, varchar_headroom, varchar_len, max_varchar_len):
+    'Oracle type for the non-null values of an object/string column'
+    if not values:
+        return f'VARCHAR2({varchar_len})'
+    if all(isinstance(value, datetime.datetime) for value in values):
+        return 'TIMESTAMP' if any(value.microsecond for value in values) else 'DATE'
+    if all(isinstance(value, datetime.date) for value in values):
+        return 'DATE'
+    if all(isinstance(value, numbers.Number) and not isinstance(value, bool) for value in values):
+        return 'NUMBER'
+    if all(isinstance(value, (bytes, bytearray)) for value in values):
+        longest = max(len(value) for value in values)
+        return 'BLOB' if longest > 2000 else f'RAW({min(2000, math.ceil(longest * varchar_headroom))})'
+    longest = max(len(str(value).encode('utf-8')) for value in values)
+    if longest > max_varchar_len:
+        return 'CLOB'
+    return f'VARCHAR2({min(max_varchar_len, max(1, math.ceil(longest * varchar_headroom)))})'
+
 def send_telegram_msg(payload, receiver, database_connector):
     'updated send_telegram logic'
     payload = payload.replace("'", '')
-    if type(receiver) is str:
-        query_for_msg = f'''
+    query_for_msg = '''
         BEGIN 
-            kpi_bot.tb_message_insert('{receiver}', '{payload}'); 
+            kpi_bot.tb_message_insert(:receiver, :payload); 
         END;
         '''
-        database_connector.execute(query_for_msg)
-    else:
-        for rec in receiver:
-            query_for_msg = f'''
-            BEGIN 
-                kpi_bot.tb_message_insert('{rec}', '{payload}'); 
-            END;
-            '''
-            database_connector.execute(query_for_msg)
+    receivers = [receiver] if type(receiver) is str else receiver
+    for rec in receivers:
+        database_connector.execute(query_for_msg, params={'receiver': rec, 'payload': payload})
 
 def send_file_via_telegram(token, chat_id, path_to_file, proxies=None, captions= None, verbose = False, parse_mode = 'html'):
+    import requests
     files = {
         'document': open(path_to_file, 'rb',),
     }
@@ -256,6 +354,7 @@ def send_file_via_telegram(token, chat_id, path_to_file, proxies=None, captions=
 
 
 def send_photo_via_telegram(token, chat_id, path_to_photo, proxies = None, captions=None, verbose=False, parse_mode='html'):
+    import requests
     files = {
         'photo': open(path_to_photo, 'rb'),
     }
@@ -271,6 +370,7 @@ def send_photo_via_telegram(token, chat_id, path_to_photo, proxies = None, capti
 
 
 def send_msg_via_telegram(token, chat_id, msg_text, proxies = None, parse_mode='html', verbose = False):
+    import requests
 
     params = {
         'chat_id': chat_id,
@@ -284,23 +384,15 @@ def send_msg_via_telegram(token, chat_id, msg_text, proxies = None, parse_mode='
 
 def send_sms(payload, receiver, database_connector):
     payload = payload.replace("'", '')
-    if type(receiver) is list:
-        for receiv in receiver:
-            query_for_msg = f'''
-            BEGIN 
-                kpi.kpi_sms_to_send(msisdn => '{receiv}', sms_txt => '{payload}');
-                COMMIT;
-            END;
-            '''
-            database_connector.execute(query_for_msg)
-    else:
-        query_for_msg = f'''
-            BEGIN 
-                kpi.kpi_sms_to_send(msisdn => '{receiver}', sms_txt => '{payload}');
-                COMMIT;
-            END;
-            '''
-        database_connector.execute(query_for_msg)
+    query_for_msg = '''
+        BEGIN 
+            kpi.kpi_sms_to_send(msisdn => :msisdn, sms_txt => :payload);
+            COMMIT;
+        END;
+        '''
+    receivers = receiver if type(receiver) is list else [receiver]
+    for receiv in receivers:
+        database_connector.execute(query_for_msg, params={'msisdn': receiv, 'payload': payload})
 
 def get_a_copy(path_to_original_file, end_path):
     try:
@@ -430,11 +522,26 @@ def voronoi_split(poly_figure, coords_list, buffer_value=2000, boundary_value=10
 
     return result
 
-def get_all_cred_dict(vault_url = pass_decoder(os.environ.get(f'VAULT_LINK_URL')), vault_token = pass_decoder(os.environ.get(f'VAULT_TKN')), path_to_secret = pass_decoder(os.environ.get(f'PATH_TO_SECRET_VLT')), mount_point = pass_decoder(os.environ.get(f'MOUNT_POINT_VLT'))):
+def _decoded_env(value, variable):
+    'value if given, otherwise the base64-decoded environment variable, read at call time'
+    if value is not None:
+        return value
+    encoded = os.environ.get(variable)
+    if encoded is None:
+        raise ValueError(f"Environment variable {variable} is not set; pass the value explicitly.")
+    return pass_decoder(encoded)
+
+def get_all_cred_dict(vault_url=None, vault_token=None, path_to_secret=None, mount_point=None):
     '''
     all_cred_dict = get_all_cred_dict(
         vault_url=url, vault_token=token, path_to_secret='xxx', mount_point='xxx')
+    Arguments left out are decoded from VAULT_LINK_URL, VAULT_TKN, PATH_TO_SECRET_VLT and MOUNT_POINT_VLT.
     '''
+    import hvac
+    vault_url = _decoded_env(vault_url, 'VAULT_LINK_URL')
+    vault_token = _decoded_env(vault_token, 'VAULT_TKN')
+    path_to_secret = _decoded_env(path_to_secret, 'PATH_TO_SECRET_VLT')
+    mount_point = _decoded_env(mount_point, 'MOUNT_POINT_VLT')
     client = hvac.Client(url=vault_url, token=vault_token)
     authenticated_status = client.is_authenticated()
     if authenticated_status:
@@ -1,17 +1,34 @@
-from nurtelecom_gras_library.OracleDataRetriever import OracleDataRetriever
-from nurtelecom_gras_library.OracleGeoDataImporter import OracleGeoDataImporter
-from nurtelecom_gras_library.additional_functions import *
+from nurtelecom_gras_library.ConnectionRegistry import ConnectionRegistry
 
+# shared by every get_db_connection call without all_cred_dict
+default_registry = ConnectionRegistry()
 
-def get_db_connection(user, database, all_cred_dict=None, geodata=False):
+
+def get_db_connection(user, database, all_cred_dict=None, geodata=False, asynchronous=False, shared=False, **kwargs):
     """
     Returns a database connection object for the specified user and database.
-    If geodata is True, returns an OracleGeoDataImporter, otherwise OracleDataRetriever.
+    If geodata is True, returns an OracleGeoDataImporter, if asynchronous is True,
+    an AsyncOracleDataRetriever, otherwise OracleDataRetriever.
+    Extra keyword arguments (use_pool, pool_min, pool_max, ...) are passed to the connection class.
+
+    Without all_cred_dict the credentials come from Vault through default_registry, which
+    caches them for its secret_ttl and re-reads them if the database rejects the password.
+    With shared=True the registry's pooled connection for (user, database, geodata) is
+    returned instead of a new object; close those with default_registry.close().
     """
+    if shared:
+        if asynchronous:
+            raise ValueError("shared connections are only available for synchronous connections.")
+        if all_cred_dict is not None:
+            raise ValueError("shared connections read their credentials through default_registry.")
+        return default_registry.get_connection(user, database, geodata=geodata, **kwargs)
+
     user = user.upper()
     database = database.upper()
     if all_cred_dict is None:
-        all_cred_dict = get_all_cred_dict()
+        all_cred_dict = default_registry.get_credentials()
+        if not asynchronous:
+            kwargs.setdefault('password_provider', default_registry.password_provider(user, database))
 
     try:
         password = all_cred_dict[f'{user}_{database}']
@@ -21,13 +38,22 @@ def get_db_connection(user, database, all_cred_dict=None, geodata=False):
     except KeyError as e:
         raise ValueError(f"Missing credential for {e.args[0]}") from e
 
-    connection_class = OracleGeoDataImporter if geodata else OracleDataRetriever
+    if geodata and asynchronous:
+        raise ValueError("geodata and asynchronous connections cannot be combined.")
+    # imported here so that plain connections do not load geopandas/shapely
+    if asynchronous:
+        from nurtelecom_gras_library.AsyncOracleDataRetriever import AsyncOracleDataRetriever as connection_class
+    elif geodata:
+        from nurtelecom_gras_library.OracleGeoDataImporter import OracleGeoDataImporter as connection_class
+    else:
+        from nurtelecom_gras_library.OracleDataRetriever import OracleDataRetriever as connection_class
     return connection_class(
         user=user,
         password=password,
         host=host,
         service_name=service_name,
         port=port,
+        **kwargs,
     )
 
 if __name__ == "__main__":
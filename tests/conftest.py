@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# the benchmarks' local Oracle stand-in doubles as the test driver
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+os.environ.setdefault('GRAS_ORACLE_THIN_MODE', '1')
+
+
+@pytest.fixture
+def fake_oracle():
+    import fake_oracle
+    return fake_oracle
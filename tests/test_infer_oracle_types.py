@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from nurtelecom_gras_library.additional_functions import infer_oracle_types
+
+
+def test_integer_columns_with_nan_stay_number():
+    df = pd.DataFrame({
+        'subscriber_id': [1, None, 3],
+        'nullable_id': pd.array([1, None, 3], dtype='Int64'),
+        'kpi_value': [1.5, None, 2.0],
+        'ratio': [np.inf, 1.0, 2.0],
+    })
+
+    column_types = infer_oracle_types(df)
+
+    assert column_types['subscriber_id'] == 'NUMBER'
+    assert column_types['nullable_id'] == 'NUMBER(19)'
+    assert column_types['kpi_value'] == 'BINARY_DOUBLE'
+    assert column_types['ratio'] == 'BINARY_DOUBLE'
@@ -0,0 +1,27 @@
+import pytest
+
+
+def test_cache_miss_get_data_is_one_call(fake_oracle, tmp_path):
+    pytest.importorskip('pyarrow')
+    retriever = fake_oracle.make_retriever(100, latency=0, bandwidth_mb=1e6)
+    retriever.enable_cache(cache_dir=str(tmp_path))
+
+    retriever.get_data('select * from bench_rows', use_cache=True)
+
+    summary = retriever.metrics.summary()
+    assert list(summary) == ['FakeOracleDataRetriever.get_data']
+    assert summary['FakeOracleDataRetriever.get_data']['calls'] == 1
+    assert summary['FakeOracleDataRetriever.get_data']['rows'] == 100
+
+
+def test_geo_get_data_is_one_call(fake_oracle):
+    pytest.importorskip('geopandas')
+    retriever = fake_oracle.make_geo_retriever(100, latency=0, bandwidth_mb=1e6)
+
+    retriever.get_data('select * from bench_geometries')
+
+    summary = retriever.metrics.summary()
+    assert len(summary) == 1
+    (total,) = summary.values()
+    assert total['calls'] == 1
+    assert total['rows'] == 100
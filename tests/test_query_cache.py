@@ -0,0 +1,33 @@
+import os
+
+import pandas as pd
+import pytest
+
+from nurtelecom_gras_library.QueryResultCache import QueryResultCache
+
+pytest.importorskip('pyarrow')
+
+
+def test_invalidate_finds_every_table_in_a_comma_separated_from(tmp_path):
+    cache = QueryResultCache(str(tmp_path))
+    query = 'select c.cell_id, r.name from dwh.dim_cells c, dim_regions r where c.region_id = r.region_id'
+    cache.put(cache.make_key(query), pd.DataFrame({'cell_id': [1]}), query=query)
+
+    assert cache.invalidate('dim_regions') == 1
+
+
+def test_whitespace_inside_literals_is_part_of_the_key(tmp_path):
+    cache = QueryResultCache(str(tmp_path))
+    assert cache.make_key("select * from t where name = 'a  b'") != cache.make_key("select * from t where name = 'a b'")
+    assert cache.make_key('select *\n  from t;') == cache.make_key('select * from t')
+
+
+def test_unreadable_index_falls_back_to_the_database(fake_oracle, tmp_path):
+    retriever = fake_oracle.make_retriever(10, latency=0, bandwidth_mb=1e6)
+    retriever.enable_cache(cache_dir=str(tmp_path))
+    with open(os.path.join(str(tmp_path), 'index.json'), 'w') as f:
+        f.write('{not json')
+
+    data = retriever.get_data('select * from bench_rows', use_cache=True)
+
+    assert len(data) == 10
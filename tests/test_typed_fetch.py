@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import oracledb
+
+
+def make_typed_retriever(fake_oracle, monkeypatch, description, rows):
+    class TypedCursor(fake_oracle.FakeCursor):
+        def execute(self, statement, parameters=None, **kwargs):
+            self.description = description
+            self._rows = iter(rows)
+
+    monkeypatch.setattr(fake_oracle.FakeConnection, 'cursor', lambda self: TypedCursor(self))
+    return fake_oracle.make_retriever(len(rows), latency=0, bandwidth_mb=1e6)
+
+
+def number(name, precision, scale):
+    return SimpleNamespace(name=name, type_code=oracledb.DB_TYPE_NUMBER, precision=precision, scale=scale)
+
+
+def test_integral_numbers_with_nulls_stay_exact(fake_oracle, monkeypatch):
+    big = 2 ** 53 + 123456789
+    description = [number('ID', 18, 0), number('CNT', 0, -127), number('ICCID', 20, 0), number('AMOUNT', 10, 2)]
+    rows = [(big, big, 89996000000000000001, 1.25), (None, None, None, None), (3, 7, 89996000000000000003, 2.5)]
+    retriever = make_typed_retriever(fake_oracle, monkeypatch, description, rows)
+
+    data = retriever.get_data('select * from t', typed=True)
+
+    assert str(data['id'].dtype) == 'Int64'
+    assert data['id'][0] == big
+    assert data['id'].isna().tolist() == [False, True, False]
+    assert str(data['cnt'].dtype) == 'Int64'
+    assert data['cnt'][0] == big
+    assert data['iccid'].tolist() == [89996000000000000001, None, 89996000000000000003]
+    assert str(data['amount'].dtype) == 'float64'
+
+
+def test_unconstrained_and_wide_numbers_keep_driver_default(fake_oracle):
+    cursor = SimpleNamespace(var=lambda kind, arraysize: kind, arraysize=100)
+    handler = fake_oracle.OracleDataRetriever._typed_output_handler
+    assert handler(cursor, number('ID', 9, 0)) is int
+    assert handler(cursor, number('AMOUNT', 10, 2)) is float
+    assert handler(cursor, number('CNT', 0, -127)) is None
+    assert handler(cursor, number('ICCID', 20, 0)) is None